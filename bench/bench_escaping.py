@@ -0,0 +1,37 @@
+"""Measure how escape() scales with template length
+
+Run with `python bench/bench_escaping.py`. Time per KB should stay flat as the
+template grows from one kilobyte to several megabytes.
+"""
+
+import timeit
+
+from fyeah._escaping import escape
+
+# a paragraph of an email body, with quotes, newlines and an expression that
+# needs custom escaping; repeated to build templates of any size
+CHUNK = (
+    'Dear {user["name"]},\n'
+    "\tyour order \"{order['id']}\" has shipped, it's on its way!\n"
+    '{ f"{total:,.2f}" # comment\n } was charged to the card ending {card[-4:]}.\n'
+)
+
+
+def bench(size, repeat=5):
+    template = CHUNK * max(1, size // len(CHUNK))
+    number = max(1, 2**20 // len(template))
+    best = min(
+        timeit.repeat(lambda: escape(template, 'f'), number=number, repeat=repeat)
+    )
+    return len(template), best / number
+
+
+def main():
+    print(f'{"template bytes":>15} {"seconds":>12} {"µs per KB":>10}')
+    for size in (2**10, 2**13, 2**16, 2**19, 2**20, 2**22):
+        length, seconds = bench(size)
+        print(f'{length:>15,} {seconds:>12.6f} {seconds / length * 1024 * 1e6:>10.2f}')
+
+
+if __name__ == '__main__':
+    main()
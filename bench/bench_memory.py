@@ -0,0 +1,73 @@
+"""Measure the memory each Template returned by t() keeps alive
+
+Run with `python bench/bench_memory.py`. Templates are built from the same
+values, so only what each Template holds beyond its values is counted.
+"""
+
+import tracemalloc
+from datetime import datetime
+from string.templatelib import Interpolation, Template
+
+import fyeah
+
+TEMPLATE = 'user {user} did {action!r} at {when:%H:%M:%S} ({elapsed:.3f}s)'
+COUNT = 100_000
+
+VALUES = {
+    'user': 'ada',
+    'action': 'login',
+    'when': datetime(2025, 1, 1, 12, 30),
+    'elapsed': 0.25,
+}
+
+
+def literal(user, action, when, elapsed):
+    return t'user {user} did {action!r} at {when:%H:%M:%S} ({elapsed:.3f}s)'
+
+
+def function(user, action, when, elapsed):
+    return fyeah.t(TEMPLATE)
+
+
+def _copy(text):
+    # a new str object with the same contents
+    return (text + '.')[:-1]
+
+
+def unshared(user, action, when, elapsed):
+    # what every Template would cost if none of its static parts were shared
+    args = []
+    for item in fyeah.t(TEMPLATE):
+        if isinstance(item, str):
+            args.append(_copy(item))
+        else:
+            args.append(
+                Interpolation(
+                    item.value,
+                    _copy(item.expression),
+                    item.conversion,
+                    _copy(item.format_spec),
+                )
+            )
+    return Template(*args)
+
+
+def per_template(build):
+    templates = [None] * COUNT
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for index in range(COUNT):
+        templates[index] = build(**VALUES)
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    assert templates[0].strings == templates[-1].strings
+    return used / COUNT
+
+
+def main():
+    for build in (literal, function, unshared):
+        print(f'{build.__name__:>10}: {per_template(build):8.1f} bytes per Template')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""Compare render_many on one core with parallel_render on increasing worker counts
+
+Run with `python bench/bench_parallel.py`.
+"""
+
+import os
+import timeit
+
+import fyeah
+
+TEMPLATE = '{name},{email},{total:.2f},{status!r},{", ".join(tags)}'
+ROWS = [
+    {
+        'name': f'user{i}',
+        'email': f'user{i}@example.com',
+        'total': i * 1.5,
+        'status': 'ok',
+        'tags': ['a', 'b', str(i)],
+    }
+    for i in range(500_000)
+]
+
+
+def render_many():
+    return list(fyeah.render_many(TEMPLATE, ROWS))
+
+
+def parallel(workers, chunksize):
+    return lambda: list(
+        fyeah.parallel_render(TEMPLATE, ROWS, workers=workers, chunksize=chunksize)
+    )
+
+
+def main():
+    cpus = os.process_cpu_count() or 1
+    benches = [('render_many', render_many)]
+    workers = 1
+    while workers <= cpus:
+        benches.append((f'parallel x{workers}', parallel(workers, 5000)))
+        workers *= 2
+    expected = render_many()
+    for label, bench in benches:
+        assert bench() == expected
+        best = min(timeit.repeat(bench, number=1, repeat=3))
+        print(f'{label:>14}: {best:6.3f} s, {best / len(ROWS) * 1e9:8.1f} ns per row')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""Compare per-row cost of rendering one template over many rows
+
+Run with `python bench/bench_render_many.py`.
+"""
+
+import timeit
+
+import fyeah
+
+TEMPLATE = '{name},{email},{total:.2f},{status!r}'
+ROWS = [
+    {
+        'name': f'user{i}',
+        'email': f'user{i}@example.com',
+        'total': i * 1.5,
+        'status': 'ok',
+    }
+    for i in range(100_000)
+]
+
+
+def literal():
+    return [
+        f'{row["name"]},{row["email"]},{row["total"]:.2f},{row["status"]!r}'
+        for row in ROWS
+    ]
+
+
+def render_many():
+    return list(fyeah.render_many(TEMPLATE, ROWS))
+
+
+def f_per_row():
+    return [fyeah.f(TEMPLATE, row) for row in ROWS]
+
+
+def main():
+    assert literal() == render_many() == f_per_row()
+    for bench in (literal, render_many, f_per_row):
+        best = min(timeit.repeat(bench, number=1, repeat=5))
+        print(f'{bench.__name__:>12}: {best / len(ROWS) * 1e9:8.1f} ns per row')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""Compare f() against a dict-lookup renderer for templates of only names and attributes
+
+Run with `python bench/bench_simple.py`.
+
+Templates like '{user} logged in from {request.ip}' could skip eval and be
+rendered by str.format_map over a mapping that searches locals, globals and
+builtins in turn. Evaluating the cached code object is faster than that, even
+when the mapping is a plain dict, so f() and t() always eval. This benchmark
+is kept so the decision can be rechecked on new Python versions.
+"""
+
+import builtins
+import timeit
+
+from fyeah import f
+from fyeah._fyeah import _compile
+
+
+class Request:
+    ip = '192.0.2.1'
+
+
+class Scope:
+    """Name lookup in the same order as eval: locals, then globals, then builtins"""
+
+    __slots__ = ('locals', 'globals')
+
+    def __init__(self, globals, locals):
+        self.globals = globals
+        self.locals = locals
+
+    def __getitem__(self, key):
+        try:
+            return self.locals[key]
+        except KeyError:
+            pass
+        try:
+            return self.globals[key]
+        except KeyError:
+            pass
+        try:
+            return builtins.__dict__[key]
+        except KeyError:
+            raise NameError(f'name {key!r} is not defined', name=key) from None
+
+
+TEMPLATE = '{user} logged in from {request.ip!r} ({count:>4})'
+NAMESPACE = {'user': 'ada', 'request': Request(), 'count': 3}
+
+
+def main():
+    code = _compile(TEMPLATE)
+    globals = {}
+    candidates = {
+        'eval cached code': lambda: eval(code, globals, NAMESPACE),
+        'format_map scope': lambda: TEMPLATE.format_map(Scope(globals, NAMESPACE)),
+        'format_map dict': lambda: TEMPLATE.format_map(NAMESPACE),
+        'f(template, ns)': lambda: f(TEMPLATE, NAMESPACE),
+    }
+    expected = f(TEMPLATE, NAMESPACE)
+    for label, render in candidates.items():
+        assert render() == expected
+        number = 200_000
+        best = min(timeit.repeat(render, number=number, repeat=5))
+        print(f'{label:>18}: {best / number * 1e9:7.1f} ns')
+
+
+if __name__ == '__main__':
+    main()
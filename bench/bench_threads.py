@@ -0,0 +1,52 @@
+"""Measure f() and t() throughput as the number of rendering threads grows
+
+Run with `python bench/bench_threads.py`. On a free-threaded build renders per
+second should grow with the thread count; with the GIL it stays flat.
+"""
+
+import sys
+import threading
+import time
+
+from fyeah import f, t
+
+TEMPLATE = '{user} ordered {count} x {item!r} for {price:.2f}'
+NAMESPACE = {'user': 'ada', 'count': 3, 'item': 'widget', 'price': 9.5}
+RENDERS = 50_000
+
+
+def worker(render, barrier):
+    barrier.wait()
+    for _ in range(RENDERS):
+        render(TEMPLATE, NAMESPACE)
+
+
+def throughput(render, threads):
+    barrier = threading.Barrier(threads + 1)
+    workers = [
+        threading.Thread(target=worker, args=(render, barrier)) for _ in range(threads)
+    ]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    return threads * RENDERS / (time.perf_counter() - start)
+
+
+def main():
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(f'GIL enabled: {gil}')
+    for render in (f, t):
+        single = throughput(render, 1)
+        for threads in (1, 2, 4, 8):
+            rate = throughput(render, threads)
+            print(
+                f'{render.__name__}() {threads} threads: {rate:12,.0f} renders/s '
+                f'({rate / single:.2f}x one thread)'
+            )
+
+
+if __name__ == '__main__':
+    main()
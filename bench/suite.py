@@ -0,0 +1,233 @@
+"""Benchmark the hot paths of f(), t(), render() and escape()
+
+Run with `nox -s bench` or `python bench/suite.py`. Results are printed and,
+with --output, saved as JSON so that runs of different versions can be compared
+with --compare.
+"""
+
+import argparse
+import html
+import json
+import platform
+import sys
+import timeit
+from importlib.metadata import PackageNotFoundError, version
+
+import fyeah
+from fyeah import f, t
+from fyeah._escaping import escape
+
+BENCHMARKS = []
+
+name = 'world'
+count = 42
+ratio = 0.125
+
+
+def benchmark(group):
+    """Register a zero-argument callable to be timed as part of group"""
+
+    def register(func):
+        BENCHMARKS.append((group, func.__name__, {}, func))
+        return func
+
+    return register
+
+
+# f() against the built-in alternatives
+
+
+@benchmark('f')
+def f_literal():
+    return f'hello {name}, you have {count} messages ({ratio:.1%})'
+
+
+@benchmark('f')
+def str_format():
+    return 'hello {name}, you have {count} messages ({ratio:.1%})'.format(
+        name=name, count=count, ratio=ratio
+    )
+
+
+@benchmark('f')
+def f_function():
+    return f('hello {name}, you have {count} messages ({ratio:.1%})')
+
+
+@benchmark('f')
+def f_namespace():
+    return f(
+        'hello {name}, you have {count} messages ({ratio:.1%})',
+        {'name': name, 'count': count, 'ratio': ratio},
+    )
+
+
+# t() against t-string literals
+
+
+@benchmark('t')
+def t_literal():
+    return t'hello {name}, you have {count} messages ({ratio:.1%})'
+
+
+@benchmark('t')
+def t_function():
+    return t('hello {name}, you have {count} messages ({ratio:.1%})')
+
+
+# render() of a Template against the f-string it stands for
+
+TEMPLATE = t'hello {name}, you have {count} messages ({ratio:.1%})'
+
+
+@benchmark('render')
+def render_template():
+    return fyeah.render(TEMPLATE)
+
+
+@benchmark('render')
+def render_escaped():
+    return fyeah.render(TEMPLATE, escape=html.escape)
+
+
+# the escape() fallback, with nested quotes and comments
+
+NESTED = ''' {""" '{name}' \'\'\' "{count}" """} and {f"{'x'!r}"} {name # comment
+}'''
+
+
+@benchmark('escape')
+def escape_nested():
+    return escape(NESTED, 'f')
+
+
+@benchmark('escape')
+def f_escaped_uncached():
+    fyeah.cache_clear()
+    return f(NESTED)
+
+
+@benchmark('escape')
+def f_escaped_cached():
+    return f(NESTED)
+
+
+# scaling with template length, expression count and stack depth
+
+
+def _length_bench(length):
+    filler = 'lorem ipsum dolor sit amet, ' * (length // 28 + 1)
+    template = filler[:length] + '{name}'
+    return lambda: f(template)
+
+
+def _exprs_bench(exprs):
+    template = ' '.join(['{count}'] * exprs)
+    return lambda: f(template)
+
+
+def _depth_bench(depth, renders=1000):
+    # render many times at the bottom so the recursion itself barely counts
+    def descend(remaining):
+        if remaining:
+            return descend(remaining - 1)
+        for _ in range(renders):
+            f('{name}')
+
+    return lambda: descend(depth)
+
+
+for _length in (128, 2048, 32768):
+    BENCHMARKS.append(
+        ('scale_length', 'f', {'length': _length}, _length_bench(_length))
+    )
+for _exprs in (1, 10, 100):
+    BENCHMARKS.append(('scale_exprs', 'f', {'exprs': _exprs}, _exprs_bench(_exprs)))
+for _depth in (0, 10, 100, 500):
+    BENCHMARKS.append(
+        ('scale_depth', 'f', {'depth': _depth, 'renders': 1000}, _depth_bench(_depth))
+    )
+
+
+def run(pattern=None, repeat=5):
+    results = []
+    for group, bench_name, params, func in BENCHMARKS:
+        if pattern and pattern not in group and pattern not in bench_name:
+            continue
+        fyeah.cache_clear()
+        timer = timeit.Timer(func)
+        number, _ = timer.autorange()
+        best = min(timer.repeat(repeat=repeat, number=number))
+        result = {
+            'group': group,
+            'name': bench_name,
+            'params': params,
+            'ns_per_call': best / number * 1e9,
+        }
+        results.append(result)
+        print(_describe(result))
+    return results
+
+
+def _describe(result):
+    params = ', '.join(f'{key}={value}' for key, value in result['params'].items())
+    label = f'{result["group"]}.{result["name"]}' + (f'[{params}]' if params else '')
+    return f'{label:<40} {result["ns_per_call"]:>14,.1f} ns'
+
+
+def _key(result):
+    return result['group'], result['name'], tuple(sorted(result['params'].items()))
+
+
+def compare(results, baseline_path):
+    with open(baseline_path) as baseline_file:
+        baseline = {
+            _key(result): result for result in json.load(baseline_file)['results']
+        }
+    print(f'\ncompared to {baseline_path}')
+    for result in results:
+        old = baseline.get(_key(result))
+        if old is None:
+            continue
+        change = result['ns_per_call'] / old['ns_per_call']
+        print(f'{_describe(result)} {change:>8.2f}x')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '-k',
+        dest='pattern',
+        help='only run benchmarks whose group or name contains this',
+    )
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', help='write results as JSON to this file')
+    parser.add_argument(
+        '--compare', help='a JSON file from an earlier run to compare against'
+    )
+    args = parser.parse_args(argv)
+
+    results = run(args.pattern, args.repeat)
+    if args.output:
+        try:
+            fyeah_version = version('f-yeah')
+        except PackageNotFoundError:
+            fyeah_version = None
+        with open(args.output, 'w') as output:
+            json.dump(
+                {
+                    'fyeah': fyeah_version,
+                    'python': sys.version,
+                    'implementation': platform.python_implementation(),
+                    'machine': platform.machine(),
+                    'results': results,
+                },
+                output,
+                indent=2,
+            )
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == '__main__':
+    main()
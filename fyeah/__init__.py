@@ -1,2 +1,19 @@
+from ._async import af, at  # noqa: F401
+from ._cache import cache_clear, cache_info, set_cache_size  # noqa: F401
+from ._catalog import Catalog  # noqa: F401
+from ._compiled import CompiledTemplate, compile, render_many  # noqa: F401
+from ._diskcache import set_cache_dir  # noqa: F401
 from ._fyeah import f  # noqa: F401
+from ._lazy import LazyTemplate, lazy  # noqa: F401
+from ._parallel import parallel_render  # noqa: F401
+from ._profile import (  # noqa: F401
+    ProfileEntry,
+    enable_profile,
+    print_profile,
+    profile,
+    reset_profile,
+)
+from ._render import render  # noqa: F401
+from ._stats import Stats, enable_stats, reset_stats, stats  # noqa: F401
+from ._stream import iter_render, render_to  # noqa: F401
 from ._tyeah import t  # noqa: F401
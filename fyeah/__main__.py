@@ -0,0 +1,43 @@
+import argparse
+import sys
+
+from ._generate import generate, load_templates
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m fyeah')
+    commands = parser.add_subparsers(dest='command', required=True)
+    compile_parser = commands.add_parser(
+        'compile',
+        help='generate a Python module with one function per template',
+        description='Generate a Python module with one function per template, '
+        'each returning the template as an f-string or t-string literal',
+    )
+    compile_parser.add_argument(
+        'source',
+        help='a directory of template files, a .toml, .json or .py file, or a module name',
+    )
+    compile_parser.add_argument(
+        '-o', '--output', help='write the module here instead of stdout'
+    )
+    compile_parser.add_argument(
+        '--kind',
+        choices=('f', 't'),
+        default='f',
+        help='generate f-strings or t-strings',
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        module = generate(load_templates(args.source), args.kind, args.source)
+    except (OSError, ImportError, TypeError, ValueError) as error:
+        compile_parser.exit(1, f'{compile_parser.prog}: error: {error}\n')
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output:
+            output.write(module)
+    else:
+        sys.stdout.write(module)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+import asyncio
+import inspect
+from ast import PyCF_ALLOW_TOP_LEVEL_AWAIT
+from string.templatelib import Interpolation, Template
+
+from . import _fyeah, _tyeah
+from ._namespace import resolve_namespaces
+from ._parse import _CONVERTERS, parse
+
+
+def af(
+    template: str, namespace=None, /, *, globals=None, locals=None, depth=1, frame=None
+):
+    """Return an awaitable of template formatted like f(), where expressions may use await
+
+    Every awaiting expression is started at once and awaited together, so the
+    render takes as long as the slowest of them rather than their sum.
+    """
+    if not isinstance(template, str):
+        raise TypeError(f'Cannot format {type(template)}')
+    globals, locals = resolve_namespaces(namespace, globals, locals, depth, frame)
+    parts = parse('f', template, _fyeah._compile_template, PyCF_ALLOW_TOP_LEVEL_AWAIT)
+    return _render(parts, globals, locals)
+
+
+def at(
+    template: str, namespace=None, /, *, globals=None, locals=None, depth=1, frame=None
+):
+    """Return an awaitable of template interpolated like t(), where expressions may use await"""
+    if not isinstance(template, str):
+        raise TypeError(f'Cannot templatize {type(template)}')
+    globals, locals = resolve_namespaces(namespace, globals, locals, depth, frame)
+    parts = parse('t', template, _tyeah._compile_template, PyCF_ALLOW_TOP_LEVEL_AWAIT)
+    return _interpolate(parts, globals, locals)
+
+
+class _Pending:
+    """Stands in for the value of an expression that is still being awaited"""
+
+    __slots__ = ('index',)
+
+    def __init__(self, index):
+        self.index = index
+
+
+async def _evaluate(parts, globals, locals):
+    """Evaluate every expression in parts, awaiting those that await concurrently
+
+    Returns one (value, format_spec) pair per field, with nested format specs
+    already rendered.
+    """
+    awaiting = []
+
+    def evaluate(code):
+        value = eval(code, globals, locals)
+        if code.co_flags & inspect.CO_COROUTINE:
+            awaiting.append(value)
+            return _Pending(len(awaiting) - 1)
+        return value
+
+    def plan(parts):
+        fields = []
+        for part in parts:
+            if isinstance(part, str):
+                continue
+            code, _, _, format_spec = part
+            value = evaluate(code)
+            if not isinstance(format_spec, str):
+                format_spec = (format_spec, plan(format_spec))
+            fields.append((value, format_spec))
+        return fields
+
+    try:
+        fields = plan(parts)
+    except BaseException:
+        for coroutine in awaiting:
+            coroutine.close()
+        raise
+    if not awaiting:
+        return fields, ()
+
+    if len(awaiting) == 1:
+        return fields, (await awaiting[0],)
+    tasks = [asyncio.ensure_future(coroutine) for coroutine in awaiting]
+    try:
+        results = await asyncio.gather(*tasks)
+    except BaseException:
+        # stop the others, as a sequential render would never have started them
+        for task in tasks:
+            task.cancel()
+        raise
+    return fields, results
+
+
+def _resolve(value, results):
+    return results[value.index] if isinstance(value, _Pending) else value
+
+
+def _format_spec(format_spec, results):
+    if isinstance(format_spec, str):
+        return format_spec
+    parts, fields = format_spec
+    return _join(parts, fields, results)
+
+
+def _join(parts, fields, results):
+    rendered = []
+    fields = iter(fields)
+    for part in parts:
+        if isinstance(part, str):
+            rendered.append(part)
+            continue
+        _, _, conversion, _ = part
+        value, format_spec = next(fields)
+        value = _resolve(value, results)
+        if conversion is not None:
+            value = _CONVERTERS[conversion](value)
+        rendered.append(format(value, _format_spec(format_spec, results)))
+    return ''.join(rendered)
+
+
+async def _render(parts, globals, locals):
+    fields, results = await _evaluate(parts, globals, locals)
+    return _join(parts, fields, results)
+
+
+async def _interpolate(parts, globals, locals):
+    fields, results = await _evaluate(parts, globals, locals)
+    args = []
+    fields = iter(fields)
+    for part in parts:
+        if isinstance(part, str):
+            args.append(part)
+            continue
+        _, expression, conversion, _ = part
+        value, format_spec = next(fields)
+        value = _resolve(value, results)
+        format_spec = _format_spec(format_spec, results)
+        args.append(Interpolation(value, expression, conversion, format_spec))
+    return Template(*args)
@@ -0,0 +1,154 @@
+import copy
+import threading
+from collections import namedtuple
+from time import perf_counter
+
+from . import _diskcache, _stats
+from ._counters import _Counters
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+DEFAULT_MAXSIZE = 1024
+
+
+class _LRUCache:
+    """A thread-safe, size-bounded mapping that evicts entries not recently used
+
+    Recency is tracked with the CLOCK algorithm: a hit only sets a flag on its
+    entry, and eviction gives flagged entries a second chance. Lookups therefore
+    never take a lock or reorder anything, so they scale across threads on
+    free-threaded builds. Only adding and evicting entries is serialized.
+
+    A maxsize of 0 disables the cache; every lookup is a miss and nothing is stored.
+    """
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE):
+        self._lock = threading.Lock()
+        # key -> [value, used since last considered for eviction]
+        self._data = {}
+        self._maxsize = _check_maxsize(maxsize)
+        self._counters = _Counters(('hits', 'misses'))
+
+    def get(self, key):
+        entry = self._data.get(key)
+        if entry is None:
+            self._counters.add('misses')
+            return None
+        if not entry[1]:
+            entry[1] = True
+        self._counters.add('hits')
+        return entry[0]
+
+    def put(self, key, value):
+        with self._lock:
+            if not self._maxsize:
+                return
+            self._data[key] = [value, False]
+            while len(self._data) > self._maxsize:
+                self._evict()
+
+    def _evict(self):
+        # oldest first; entries used since they were last considered go to the back
+        while True:
+            key = next(iter(self._data))
+            entry = self._data.pop(key)
+            if not entry[1]:
+                return
+            entry[1] = False
+            self._data[key] = entry
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._counters.reset()
+
+    def info(self):
+        counts = self._counters.totals()
+        return CacheInfo(
+            counts['hits'], counts['misses'], self._maxsize, len(self._data)
+        )
+
+    def resize(self, maxsize):
+        maxsize = _check_maxsize(maxsize)
+        with self._lock:
+            self._maxsize = maxsize
+            while len(self._data) > maxsize:
+                self._evict()
+
+
+def _check_maxsize(maxsize):
+    if not isinstance(maxsize, int) or isinstance(maxsize, bool):
+        raise TypeError(f'Cache size must be an int, not {type(maxsize)}')
+    if maxsize < 0:
+        raise ValueError(f'Cache size cannot be negative, got {maxsize}')
+    return maxsize
+
+
+# process-wide cache of compiled template code objects, keyed by (prefix, template)
+code_cache = _LRUCache()
+# the SyntaxError of each template that failed to compile, keyed like code_cache
+error_cache = _LRUCache()
+# templates that only compile once escaped, keyed by (kind, template)
+escaped_templates = _LRUCache()
+
+
+def cached_compile(prefix, template, compile_template):
+    """Return the code object for template, only calling compile_template when it isn't cached
+
+    A SyntaxError from compile_template is cached too, and raised again
+    straight away for later calls with the same template.
+    """
+    key = (prefix, template)
+    counting = _stats.enabled
+    code = code_cache.get(key)
+    if code is not None:
+        if counting:
+            _stats.record(cache_hits=1)
+        return code
+
+    error = error_cache.get(key)
+    if error is not None:
+        # nothing usable was cached, so a miss, as cache_info() counts it
+        if counting:
+            _stats.record(cache_misses=1)
+        # a fresh copy, so tracebacks don't pile up on the cached one
+        raise copy.copy(error)
+
+    if counting:
+        start = perf_counter()
+    disk_cache = _diskcache.disk_cache
+    if disk_cache is not None:
+        code = disk_cache.load(prefix, template)
+    if code is None:
+        try:
+            code = compile_template(template)
+        except SyntaxError as error:
+            error_cache.put(key, copy.copy(error))
+            if counting:
+                _stats.record(cache_misses=1, compile_seconds=perf_counter() - start)
+            raise
+        if disk_cache is not None:
+            disk_cache.store(prefix, template, code)
+    code_cache.put(key, code)
+    if counting:
+        _stats.record(cache_misses=1, compile_seconds=perf_counter() - start)
+    return code
+
+
+def cache_info() -> CacheInfo:
+    """Report hits, misses, maximum and current size of the compiled template cache"""
+    return code_cache.info()
+
+
+def cache_clear() -> None:
+    """Empty the compiled template cache and reset its statistics"""
+    code_cache.clear()
+    error_cache.clear()
+    escaped_templates.clear()
+
+
+def set_cache_size(maxsize: int) -> None:
+    """Change how many compiled templates are kept; 0 disables caching entirely"""
+    code_cache.resize(maxsize)
+    error_cache.resize(maxsize)
+    escaped_templates.resize(maxsize)
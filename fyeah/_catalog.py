@@ -0,0 +1,154 @@
+import json
+import os
+import tomllib
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+
+from ._fyeah import _compile as _compile_f
+from ._namespace import resolve_namespaces
+from ._tyeah import _compile as _compile_t
+
+_COMPILERS = {'f': _compile_f, 't': _compile_t}
+
+
+class Catalog(Mapping):
+    """A collection of named templates, each compiled the first time it is rendered
+
+    A catalog maps names to template strings. Create one from a mapping, or
+    with from_path() from a directory of template files or a TOML or JSON file.
+    """
+
+    def __init__(self, templates):
+        # values are template strings, or the path of a file not yet read
+        self._templates = dict(templates)
+        self._compiled = {}
+
+    @classmethod
+    def from_path(cls, path):
+        """Load templates from a directory or a TOML or JSON file
+
+        In a directory each file, read exactly as it is, is a template named
+        after the file without its suffix. In TOML or JSON nested tables give
+        dotted names. Files are only read once one of their templates is used.
+        """
+        path = os.fspath(path)
+        if os.path.isdir(path):
+            templates = {}
+            for entry in os.scandir(path):
+                if entry.is_file() and not entry.name.startswith('.'):
+                    name = os.path.splitext(entry.name)[0]
+                    if name in templates:
+                        raise ValueError(
+                            f'Files {templates[name].path!r} and {entry.path!r} '
+                            f'would both be named {name!r}'
+                        )
+                    templates[name] = _Unread(entry.path)
+            return cls(templates)
+        suffix = os.path.splitext(path)[1].lower()
+        if suffix == '.toml':
+            loaded = tomllib.loads(_read(path))
+        elif suffix == '.json':
+            loaded = json.loads(_read(path))
+        else:
+            raise ValueError(
+                f'Cannot load a catalog from {path!r}, expected a directory or .toml or .json file'
+            )
+        return cls(_flatten(loaded))
+
+    def __repr__(self):
+        return f'{type(self).__name__}({sorted(self._templates)!r})'
+
+    def __getitem__(self, name):
+        template = self._templates[name]
+        if isinstance(template, _Unread):
+            template = self._templates[name] = _read(template.path)
+        return template
+
+    def __contains__(self, name):
+        # don't read a file just to see that it exists
+        return name in self._templates
+
+    def __iter__(self):
+        return iter(self._templates)
+
+    def __len__(self):
+        return len(self._templates)
+
+    def _code(self, kind, name):
+        try:
+            return self._compiled[kind, name]
+        except KeyError:
+            code = self._compiled[kind, name] = _COMPILERS[kind](self[name])
+            return code
+
+    def warm(self, kinds=('f',), max_workers=None) -> None:
+        """Compile every template now, spreading the work over a pool of threads"""
+        for kind in kinds:
+            if kind not in _COMPILERS:
+                raise ValueError(f"kind must be 'f' or 't', not {kind!r}")
+        jobs = [(kind, name) for kind in kinds for name in self._templates]
+        with ThreadPoolExecutor(max_workers) as pool:
+            # list() to raise the first compile error here
+            list(pool.map(lambda job: self._code(*job), jobs))
+
+    def f(
+        self,
+        name: str,
+        namespace=None,
+        /,
+        *,
+        globals=None,
+        locals=None,
+        depth=1,
+        frame=None,
+    ) -> str:
+        """Render the named template like f(), in the caller's scope or the given namespace"""
+        globals, locals = resolve_namespaces(namespace, globals, locals, depth, frame)
+        return eval(self._code('f', name), globals, locals)
+
+    def t(
+        self,
+        name: str,
+        namespace=None,
+        /,
+        *,
+        globals=None,
+        locals=None,
+        depth=1,
+        frame=None,
+    ):
+        """Interpolate the named template like t(), in the caller's scope or the given namespace"""
+        globals, locals = resolve_namespaces(namespace, globals, locals, depth, frame)
+        return eval(self._code('t', name), globals, locals)
+
+
+class _Unread:
+    __slots__ = ('path',)
+
+    def __init__(self, path):
+        self.path = path
+
+
+def _read(path):
+    # binary, so templates keep their line endings exactly as written
+    with open(path, 'rb') as file:
+        return file.read().decode()
+
+
+def _flatten(loaded, prefix=''):
+    templates = {}
+    for name, value in loaded.items():
+        if isinstance(value, dict):
+            nested = _flatten(value, f'{prefix}{name}.')
+        elif isinstance(value, str):
+            nested = {prefix + name: value}
+        else:
+            raise TypeError(
+                f'Template {prefix + name!r} must be a string, not {type(value)}'
+            )
+        if collisions := nested.keys() & templates.keys():
+            raise ValueError(
+                f'More than one template would be named {min(collisions)!r}'
+            )
+        templates.update(nested)
+    return templates
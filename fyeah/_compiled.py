@@ -0,0 +1,62 @@
+import builtins
+
+from ._fyeah import _compile as _compile_f
+from ._namespace import caller_namespaces, namespaces
+from ._tyeah import _compile as _compile_t
+
+_COMPILERS = {'f': _compile_f, 't': _compile_t}
+
+
+def compile(template: str, kind: str = 'f') -> CompiledTemplate:
+    """Escape and compile template once, returning an object that can render it many times"""
+    if not isinstance(template, str):
+        raise TypeError(f'Cannot compile {type(template)}')
+    try:
+        compiler = _COMPILERS[kind]
+    except KeyError:
+        raise ValueError(f"kind must be 'f' or 't', not {kind!r}") from None
+    return CompiledTemplate(template, kind, compiler(template))
+
+
+def render_many(template: str, rows, kind: str = 'f'):
+    """Compile template once and lazily render it against each mapping in rows"""
+    return compile(template, kind).render_many(rows)
+
+
+class CompiledTemplate:
+    """A template that has already been compiled into an f-string or t-string expression"""
+
+    __slots__ = ('_code', 'kind', 'template')
+
+    def __init__(self, template, kind, code):
+        self.template = template
+        self.kind = kind
+        self._code = code
+
+    def __repr__(self):
+        return f'fyeah.compile({self.template!r}, kind={self.kind!r})'
+
+    def __reduce__(self):
+        # code objects can't be pickled, compile again on the other side
+        return compile, (self.template, self.kind)
+
+    def render(self, *, depth=1, frame=None):
+        """Evaluate the template in the caller's scope, like f() or t()
+
+        depth and frame choose another scope, as they do for f() and t().
+        """
+        globals, locals = caller_namespaces(depth, frame)
+        return eval(self._code, globals, locals)
+
+    def render_with(self, namespace=None, /, *, globals=None, locals=None):
+        """Evaluate the template against the given mappings instead of the caller's scope"""
+        globals, locals = namespaces(namespace, globals, locals)
+        return eval(self._code, globals, locals)
+
+    def render_many(self, rows):
+        """Yield the template rendered against each mapping in rows, in order"""
+        code = self._code
+        # one globals for the whole batch; each row is only ever the locals
+        globals = {'__builtins__': builtins}
+        for row in rows:
+            yield eval(code, globals, row)
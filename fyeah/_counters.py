@@ -0,0 +1,62 @@
+import threading
+
+
+class _Counters:
+    """Named counters kept separately by each thread and summed when read
+
+    Incrementing only touches the calling thread's own dict, so without the GIL
+    threads never contend on a shared counter or lock. Totals read while other
+    threads are counting may miss their latest increments.
+    """
+
+    def __init__(self, fields):
+        self._fields = tuple(fields)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._per_thread = []
+        # counts from threads that have exited
+        self._retired = dict.fromkeys(self._fields, 0)
+
+    def _counts(self):
+        try:
+            return self._local.counts
+        except AttributeError:
+            counts = self._local.counts = dict.fromkeys(self._fields, 0)
+            with self._lock:
+                self._retire_dead()
+                self._per_thread.append((threading.current_thread(), counts))
+            return counts
+
+    def _retire_dead(self):
+        alive = []
+        for thread, counts in self._per_thread:
+            if thread.is_alive():
+                alive.append((thread, counts))
+            else:
+                for field, amount in counts.items():
+                    self._retired[field] += amount
+        self._per_thread = alive
+
+    def add(self, field, amount=1):
+        self._counts()[field] += amount
+
+    def update(self, amounts):
+        counts = self._counts()
+        for field, amount in amounts.items():
+            counts[field] += amount
+
+    def totals(self):
+        with self._lock:
+            self._retire_dead()
+            totals = dict(self._retired)
+            for _, counts in self._per_thread:
+                for field, amount in counts.items():
+                    totals[field] += amount
+        return totals
+
+    def reset(self):
+        with self._lock:
+            self._retire_dead()
+            for counts in (self._retired, *(counts for _, counts in self._per_thread)):
+                for field in counts:
+                    counts[field] = 0
@@ -0,0 +1,126 @@
+import hashlib
+import marshal
+import os
+import sys
+import tempfile
+import threading
+from importlib.util import MAGIC_NUMBER
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+_SUFFIX = '.fyc'
+
+
+class _DiskCache:
+    """Compiled templates marshalled into a directory, shared between processes
+
+    Every failure to read or write the cache is ignored; the template is just
+    compiled again, the same as when __pycache__ can't be used.
+    """
+
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_BYTES):
+        # marshal format and bytecode are only valid for one interpreter version
+        self.directory = os.path.join(
+            os.fspath(directory), sys.implementation.cache_tag
+        )
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+        self._approx_bytes = sum(size for _, size, _ in self._entries())
+
+    def _path(self, prefix, template):
+        key = hashlib.sha256(
+            prefix.encode() + b'\0' + template.encode('utf-8', 'surrogatepass')
+        )
+        return os.path.join(self.directory, key.hexdigest() + _SUFFIX)
+
+    def load(self, prefix, template):
+        path = self._path(prefix, template)
+        try:
+            with open(path, 'rb') as cached:
+                data = cached.read()
+            # mark as recently used, so it is evicted last
+            os.utime(path)
+        except OSError:
+            return None
+        if not data.startswith(MAGIC_NUMBER):
+            return None
+        try:
+            stored_prefix, stored_template, code = marshal.loads(
+                data[len(MAGIC_NUMBER) :]
+            )
+        except EOFError, ValueError, TypeError:
+            return None
+        if stored_prefix != prefix or stored_template != template:
+            return None
+        return code
+
+    def store(self, prefix, template, code):
+        data = MAGIC_NUMBER + marshal.dumps((prefix, template, code))
+        try:
+            # write to a private file then atomically move it into place,
+            # so other processes never see a partial entry
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as temp:
+                    temp.write(data)
+                os.replace(temp_path, self._path(prefix, template))
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except OSError:
+            return
+        with self._lock:
+            self._approx_bytes += len(data)
+            if self._approx_bytes > self.max_bytes:
+                self._evict()
+
+    def _entries(self):
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return []
+        entries = []
+        for name in names:
+            if not name.endswith(_SUFFIX):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _evict(self):
+        # other processes share the directory, so sizes are recounted from disk
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+        self._approx_bytes = total
+
+
+disk_cache = None
+if os.environ.get('FYEAH_CACHE_DIR'):
+    try:
+        disk_cache = _DiskCache(os.environ['FYEAH_CACHE_DIR'])
+    except OSError:
+        pass
+
+
+def set_cache_dir(directory, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+    """Persist compiled templates under directory, or with None stop using a disk cache
+
+    The FYEAH_CACHE_DIR environment variable sets a directory at import time.
+    """
+    global disk_cache
+    if directory is None:
+        disk_cache = None
+    else:
+        disk_cache = _DiskCache(directory, max_bytes)
@@ -1,7 +1,23 @@
+import re
+
+
 def escape(string, stype):
     return _Escape(stype)(string)
 
 
+# where a literal section might stop being a plain run of characters
+_LITERAL_STOPS = {
+    None: re.compile(r'\{'),
+    '"': re.compile(r'\{|"'),
+    "'": re.compile(r"\{|'"),
+    '"""': re.compile(r'\{|"""'),
+    "'''": re.compile(r"\{|'''"),
+}
+# where an expression section might stop being a plain run of characters
+_EXPR_STOPS = re.compile(r'[{}#"\']')
+_QUOTES = re.compile(r'(["\'])')
+
+
 class _Escape:
     """Given a string containing expression components, return an escaped view of that string that is valid source representation"""
 
@@ -23,42 +39,48 @@ class _Escape:
             done = self._escape_literal(end)
 
     def _escape_literal(self, end=None):
-        while self.looking < len(self.original_str):
-            if self.original_str[self.looking : self.looking + 2] == '{{':
-                # two {{ don't start an expr
-                self.repr_parts.append('{{')
-                self.looking += 2
-                continue
-            if self.original_str[self.looking] == '{':
-                self.repr_parts.append('{')
-                self.looking += 1
-                return False
-            if end and end == self.original_str[self.looking : self.looking + len(end)]:
+        original_str = self.original_str
+        stops = _LITERAL_STOPS[end]
+        while True:
+            stop = stops.search(original_str, self.looking)
+            if stop is None:
+                break
+            if stop.start() > self.looking:
+                self.repr_parts.append(
+                    _repr_literal(original_str[self.looking : stop.start()])
+                )
+            self.looking = stop.end()
+            if stop.group() != '{':
                 # found the other end of a nested expr-containing string
                 # don't need to escape quotes as this is a string token
                 self.repr_parts.append(end)
-                self.looking += len(end)
                 return True
-
-            raw_chr = self.original_str[self.looking]
-            raw_repr = repr(raw_chr)[1:-1]
-            if raw_chr in ('"', "'"):
-                # repr of a single quote will never add a backslash, instead it always uses opposite quotes to contain it
-                raw_repr = '\\' + raw_chr
-            if raw_chr != raw_repr:
-                self.repr_parts.append(raw_repr)
-            else:
-                self.repr_parts.append(raw_chr)
-            self.looking += 1
+            if original_str[self.looking : self.looking + 1] == '{':
+                # two {{ don't start an expr
+                self.repr_parts.append('{{')
+                self.looking += 1
+                continue
+            self.repr_parts.append('{')
+            return False
 
         if end:
             raise SyntaxError('unterminated string literal')
+        if self.looking < len(original_str):
+            self.repr_parts.append(_repr_literal(original_str[self.looking :]))
+            self.looking = len(original_str)
         return True
 
     def _escape_expr(self):
+        original_str = self.original_str
         braces = 0
-        while self.looking < len(self.original_str):
-            here = self.original_str[self.looking]
+        while True:
+            stop = _EXPR_STOPS.search(original_str, self.looking)
+            if stop is None:
+                break
+            # everything up to the next special character is copied unchanged
+            self.repr_parts.append(original_str[self.looking : stop.start()])
+            self.looking = stop.start()
+            here = stop.group()
             if here == '}':
                 self.repr_parts.append(here)
                 self.looking += 1
@@ -67,38 +89,49 @@ class _Escape:
                 else:
                     return
             elif here == '#':
-                nl = self.original_str.find('\n', self.looking)
+                nl = original_str.find('\n', self.looking)
                 if nl == -1:
                     raise SyntaxError("'{' was never closed")
-                self.repr_parts.append(self.original_str[self.looking : nl + 1])
+                self.repr_parts.append(original_str[self.looking : nl + 1])
                 self.looking = nl + 1
             elif here in ('"', "'"):
-                quote, contains_exprs = _quote_type(self.original_str, self.looking)
+                quote, contains_exprs = _quote_type(original_str, self.looking)
                 if contains_exprs:
                     self.repr_parts.append(quote)
                     self.looking += len(quote)
                     self._escape(end=quote)
-                elif quote is not None:
-                    there = _find_string_end(self.original_str, self.looking, quote)
+                else:
+                    there = _find_string_end(original_str, self.looking, quote)
                     if len(quote) == 1:
-                        new_string = self.original_str[self.looking + 1 : there]
+                        new_string = original_str[self.looking + 1 : there]
                     else:
-                        new_string = self.original_str[self.looking + 3 : there - 2]
+                        new_string = original_str[self.looking + 3 : there - 2]
                     self.repr_parts.append(repr(new_string))
                     self.looking = there + 1
-                else:
-                    self.repr_parts.append(self.original_str[self.looking])
-                    self.looking += 1
             else:
+                # dict or set or format expr
                 self.repr_parts.append(here)
                 self.looking += 1
-                if here == '{':
-                    # dict or set or format expr
-                    braces += 1
+                braces += 1
 
         raise SyntaxError(f"{self.prefix}-string: expecting '}}'")
 
 
+def _repr_literal(run):
+    """Return the escaped source form of a run of literal characters
+
+    The repr of a string without quotes escapes each character independently,
+    so whole quote-free runs are converted at once. Quotes are always
+    backslashed, as repr of a lone quote uses the opposite quotes to contain it.
+    """
+    if '"' not in run and "'" not in run:
+        return repr(run)[1:-1]
+    return ''.join(
+        '\\' + part if part in ('"', "'") else repr(part)[1:-1]
+        for part in _QUOTES.split(run)
+    )
+
+
 def _quote_type(string, qidx):
     """Given the index of a quote character, figure out what string it is starting
 
@@ -118,20 +151,11 @@ def _quote_type(string, qidx):
     double-quote t-string
     triple single-quote t-string
     triple double-quote t-string
-    not a string (escaped quote)
 
     Returns a tuple of
-      quote: one of ' " ''' \"\"\" or None
+      quote: one of ' " ''' \"\"\"
       contains_exprs: bool
     """
-    escapes = 0
-    for c in range(qidx - 1, -1, -1):
-        if c != '\\':
-            break
-        escapes += 1
-    if escapes % 2 == 1:
-        return None, False
-
     if string[qidx - 1 : qidx] in ('f', 'F', 't', 'T') or (
         string[qidx - 1 : qidx] in ('r', 'R')
         and string[qidx - 2 : qidx - 1] in ('f', 'F', 't', 'T')
@@ -152,8 +176,7 @@ def _find_string_end(string, start, quote):
     quote can be " ' \"\"\" or '''
     raises a SyntaxError when the string has no end
     """
-    start += len(quote)
-    nextq_idx = string.find(quote, start)
+    nextq_idx = string.find(quote, start + len(quote))
     if nextq_idx == -1:
         if len(quote) == 3:
             raise SyntaxError('unterminated triple-quoted string literal')
@@ -161,16 +184,4 @@ def _find_string_end(string, start, quote):
         # was a newline or a \n in the original source, so don't check for
         # unterminated string literals by line-end, they will all get escaped to \n
         raise SyntaxError('unterminated string literal')
-
-    escapes = 0
-    for c in range(nextq_idx - 1, -1, -1):
-        if c != '\\':
-            break
-        escapes += 1
-    if escapes % 2 == 1:
-        return _find_string_end(string, nextq_idx, quote)
-
-    if len(quote) == 3:
-        return nextq_idx + 2
-    else:
-        return nextq_idx
+    return nextq_idx + len(quote) - 1
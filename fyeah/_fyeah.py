@@ -1,24 +1,79 @@
-import inspect
+from time import perf_counter
 
+from . import _profile, _stats
+from ._cache import cached_compile, escaped_templates
 from ._escaping import escape
+from ._namespace import resolve_namespaces
+from ._parse import parse, render_once
 
 
-def f(template: str) -> str:
+def f(
+    template: str,
+    namespace=None,
+    /,
+    *,
+    globals=None,
+    locals=None,
+    dedupe=False,
+    depth=1,
+    frame=None,
+) -> str:
     if not isinstance(template, str):
         raise TypeError(f'Cannot format {type(template)}')
-    parent_frame = inspect.stack()[1].frame
-    # add quotes around template
-    f = 'f' + repr(template)
-    try:
-        formatted = eval(f, parent_frame.f_globals, parent_frame.f_locals)
-    except SyntaxError as repr_error:
-        # custom escaping, in Python, of the string is expensive and only
-        # necessary in very unusual scenarios
-        f = escape(template, 'f')
-        try:
-            formatted = eval(f, parent_frame.f_globals, parent_frame.f_locals)
-        except SyntaxError:
-            # custom escaping didn't help, show the original error
-            raise repr_error from None
+    globals, locals = resolve_namespaces(namespace, globals, locals, depth, frame)
+    if _profile.enabled:
+        code = parse('f', template, _compile_template)
+        evaluate = _profile.renderer('f', template, dedupe)
+    elif dedupe:
+        # render part by part, evaluating each distinct expression once
+        code = parse('f', template, _compile_template)
+        evaluate = render_once
+    else:
+        code = _compile(template)
+        evaluate = eval
+    if _stats.enabled:
+        start = perf_counter()
+        formatted = evaluate(code, globals, locals)
+        _stats.record(f_renders=1, eval_seconds=perf_counter() - start)
+    else:
+        formatted = evaluate(code, globals, locals)
     assert isinstance(formatted, str)
     return formatted
+
+
+def _compile(template):
+    return cached_compile('f', template, _compile_template)
+
+
+def _compile_template(template, flags=0):
+    return _compile_source(template, flags)[1]
+
+
+def _compile_source(template, flags=0):
+    """Return the f-string source for template along with its compiled code"""
+    if escaped_templates.get(('f', template)) is None:
+        # add quotes around template
+        f = 'f' + repr(template)
+        try:
+            code = compile(f, '<string>', 'eval', flags)
+        except SyntaxError as repr_error:
+            # custom escaping, in Python, of the string is expensive and only
+            # necessary in very unusual scenarios
+            f = escape(template, 'f')
+            try:
+                code = compile(f, '<string>', 'eval', flags)
+            except SyntaxError:
+                # custom escaping didn't help, show the original error
+                raise repr_error from None
+            escaped_templates.put(('f', template), True)
+        else:
+            if _stats.enabled:
+                _stats.record(repr_compiles=1)
+            return f, code
+    else:
+        # compiled with escaping before, don't try repr again
+        f = escape(template, 'f')
+        code = compile(f, '<string>', 'eval', flags)
+    if _stats.enabled:
+        _stats.record(escape_compiles=1)
+    return f, code
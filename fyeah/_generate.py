@@ -0,0 +1,109 @@
+import builtins
+import importlib
+import importlib.util
+import keyword
+import os
+import re
+import symtable
+
+from ._catalog import Catalog
+from ._fyeah import _compile_source as _compile_f_source
+from ._tyeah import _compile_source as _compile_t_source
+
+_SOURCE_COMPILERS = {'f': _compile_f_source, 't': _compile_t_source}
+
+
+def load_templates(source):
+    """Read the templates to generate functions for
+
+    source is a directory, TOML or JSON file as read by Catalog.from_path(), a
+    .py file, or the name of an importable module. From a module every public
+    str constant is a template.
+    """
+    if os.path.isdir(source) or source.endswith(('.toml', '.json')):
+        return dict(Catalog.from_path(source))
+    if source.endswith('.py'):
+        name = os.path.splitext(os.path.basename(source))[0]
+        spec = importlib.util.spec_from_file_location(name, source)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    else:
+        module = importlib.import_module(source)
+    return {
+        name: value
+        for name, value in vars(module).items()
+        if isinstance(value, str) and not name.startswith('_')
+    }
+
+
+def generate(templates, kind='f', source=None):
+    """Return the source of a module with one function rendering each template
+
+    Each function returns the template as an f-string or t-string literal and
+    takes every name the template looks up as a keyword-only parameter. Names
+    of builtins default to the builtin, looked up through the builtins module
+    so that a template named like a builtin doesn't take its place.
+    """
+    try:
+        compile_source = _SOURCE_COMPILERS[kind]
+    except KeyError:
+        raise ValueError(f"kind must be 'f' or 't', not {kind!r}") from None
+    # repr() escapes backslashes and newlines, and escaping " stops any path
+    # from ending the docstring early
+    origin = f' from {source!r}'.replace('"', '\\"') if source else ''
+    docstring = (
+        f'"""Templates compiled{origin} by `python -m fyeah compile`\n\n'
+        'Do not edit, compile the templates again instead.\n"""\n'
+    )
+    chunks = []
+    uses_builtins = False
+    functions = {}
+    for name, template in templates.items():
+        function = _function_name(name)
+        if function in functions:
+            raise ValueError(
+                f'Templates {functions[function]!r} and {name!r} would both be named {function}'
+            )
+        functions[function] = name
+        try:
+            literal, _ = compile_source(template)
+        except SyntaxError as error:
+            raise ValueError(f'Template {name!r} is not valid: {error.msg}') from error
+        parameters = []
+        for parameter in _free_names(literal):
+            if hasattr(builtins, parameter):
+                uses_builtins = True
+                parameter = f'{parameter}=builtins.{parameter}'
+            parameters.append(parameter)
+        signature = f'*, {", ".join(parameters)}' if parameters else ''
+        chunks.append(f'\n\ndef {function}({signature}):\n    return {literal}\n')
+    if uses_builtins:
+        if 'builtins' in functions:
+            raise ValueError(
+                f'Template {functions["builtins"]!r} would hide the builtins module '
+                'the other templates use'
+            )
+        docstring += '\nimport builtins\n'
+    return docstring + ''.join(chunks)
+
+
+def _function_name(name):
+    function = re.sub(r'\W', '_', name)
+    if not function or function[0].isdigit():
+        function = '_' + function
+    if keyword.iskeyword(function):
+        function += '_'
+    return function
+
+
+def _free_names(literal):
+    # the names a function returning literal looks up outside itself,
+    # including from lambdas and comprehensions nested in its expressions
+    table = symtable.symtable(f'def _():\n    return {literal}\n', '<template>', 'exec')
+    names = set()
+    tables = table.get_children()
+    while tables:
+        table = tables.pop()
+        names.update(table.get_globals())
+        tables.extend(table.get_children())
+    return sorted(names)
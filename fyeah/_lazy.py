@@ -0,0 +1,42 @@
+from ._fyeah import _compile
+from ._namespace import resolve_namespaces
+
+
+def lazy(
+    template: str, namespace=None, /, *, globals=None, locals=None, depth=1, frame=None
+) -> LazyTemplate:
+    """Capture the caller's names now but only format template when the result is used"""
+    if not isinstance(template, str):
+        raise TypeError(f'Cannot format {type(template)}')
+    # bind function locals as they are now, like f() would
+    globals, locals = resolve_namespaces(
+        namespace, globals, locals, depth, frame, bind=True
+    )
+    return LazyTemplate(template, globals, locals)
+
+
+class LazyTemplate:
+    """An f-template that is compiled and evaluated the first time it is converted to a string"""
+
+    __slots__ = ('_formatted', '_globals', '_locals', 'template')
+
+    def __init__(self, template, globals, locals):
+        self.template = template
+        self._globals = globals
+        self._locals = locals
+        self._formatted = None
+
+    def __repr__(self):
+        return f'fyeah.lazy({self.template!r})'
+
+    def __str__(self):
+        if self._formatted is None:
+            formatted = eval(_compile(self.template), self._globals, self._locals)
+            assert isinstance(formatted, str)
+            self._formatted = formatted
+            # the namespace is no longer needed, don't keep its values alive
+            self._globals = self._locals = None
+        return self._formatted
+
+    def __format__(self, format_spec):
+        return format(str(self), format_spec)
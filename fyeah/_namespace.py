@@ -0,0 +1,57 @@
+import sys
+
+
+def namespaces(namespace, globals, locals):
+    """Resolve the explicit namespace arguments of f() and t() into eval's globals and locals
+
+    A single namespace mapping is used for name lookups only and is never
+    modified by having __builtins__ inserted into it.
+    """
+    if namespace is not None:
+        if globals is not None or locals is not None:
+            raise TypeError('Cannot give both a namespace and globals or locals')
+        return {}, namespace
+    if globals is None:
+        return {}, locals
+    if locals is None:
+        return globals, globals
+    return globals, locals
+
+
+def caller_namespaces(depth=1, frame=None, bind=False):
+    """Return the globals and locals of frame or, without one, of the function depth calls
+    above the one calling this
+
+    Only the frames in between are walked, so the cost doesn't grow with the
+    depth of the whole stack the way inspect.stack() does. With bind, function
+    locals are copied so that later assignments don't change what is rendered.
+    """
+    return _frame_namespaces(depth, frame, bind)
+
+
+def resolve_namespaces(namespace, globals, locals, depth=1, frame=None, bind=False):
+    """Resolve the namespace arguments of f(), t() and the like into eval's globals and locals
+
+    Without a namespace, globals or locals these come from the caller's scope,
+    chosen by depth and frame as in caller_namespaces().
+    """
+    if namespace is None and globals is None and locals is None:
+        return _frame_namespaces(depth, frame, bind)
+    if frame is not None:
+        raise TypeError('Cannot give both a frame and a namespace, globals or locals')
+    return namespaces(namespace, globals, locals)
+
+
+def _frame_namespaces(depth, frame, bind):
+    # only called straight from caller_namespaces() and resolve_namespaces(),
+    # so depth counts from the function calling one of them
+    if frame is None:
+        if depth < 1:
+            raise ValueError(f'depth must be at least 1, got {depth}')
+        # two more to skip this and the function calling it
+        frame = sys._getframe(depth + 2)
+    globals, locals = frame.f_globals, frame.f_locals
+    if bind and locals is not globals:
+        # module namespaces are shared and too large to copy
+        locals = dict(locals)
+    return globals, locals
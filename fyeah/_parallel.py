@@ -0,0 +1,55 @@
+import itertools
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from ._compiled import compile
+
+DEFAULT_CHUNKSIZE = 1000
+
+# the template each worker process renders, set once by _init_worker
+_worker_template = None
+
+
+def parallel_render(
+    template: str, rows, workers=None, chunksize=DEFAULT_CHUNKSIZE, kind: str = 'f'
+):
+    """Render template against each mapping in rows on a pool of processes
+
+    The template is sent to and compiled by each worker once. Rows, which must
+    be picklable, are sent in chunks of chunksize and the rendered results are
+    yielded in the same order as rows. workers defaults to the number of CPUs.
+    """
+    if chunksize < 1:
+        raise ValueError(f'chunksize must be at least 1, got {chunksize}')
+    # compile here first so a bad template fails before any process is started
+    compiled = compile(template, kind)
+    return _render(compiled, rows, workers, chunksize)
+
+
+def _render(compiled, rows, workers, chunksize):
+    if workers is None:
+        workers = os.process_cpu_count() or 1
+    pool = ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(compiled,))
+    try:
+        # keep a couple of chunks per worker in flight rather than submitting
+        # every row at once, so rows can be an arbitrarily long iterator
+        limit = 2 * workers
+        pending = deque()
+        for chunk in itertools.batched(rows, chunksize):
+            pending.append(pool.submit(_render_chunk, chunk))
+            if len(pending) >= limit:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
+def _init_worker(compiled):
+    global _worker_template
+    _worker_template = compiled
+
+
+def _render_chunk(rows):
+    return list(_worker_template.render_many(rows))
@@ -0,0 +1,188 @@
+import ast
+from string.templatelib import Interpolation, Template
+from time import perf_counter
+
+from ._cache import cached_compile
+
+_CONVERTERS = {'s': str, 'r': repr, 'a': ascii}
+
+
+def parse(prefix, template, compile_template, flags=0):
+    """Split template into its literal strings and one field per interpolation
+
+    Returns a tuple whose items are either a literal str or a field tuple of
+      code: code object evaluating the expression
+      expression: the expression's source text
+      conversion: one of 's' 'r' 'a' or None
+      format_spec: a str, or a tuple of parts when the spec has its own fields
+
+    Parsing reuses the escaping of compile_template, so a template splits
+    exactly where its compiled f-string or t-string would. flags are passed on
+    to compile() for each expression.
+    """
+    return cached_compile(
+        f'{prefix}-parts-{flags}',
+        template,
+        lambda template: _split(compile_template, template, flags),
+    )
+
+
+def _split(compile_template, template, flags):
+    tree = compile_template(template, ast.PyCF_ONLY_AST)
+    return _parts(tree.body, flags)
+
+
+def _parts(node, flags):
+    parts = []
+    for value in node.values:
+        if isinstance(value, ast.Constant):
+            parts.append(value.value)
+            continue
+        code = compile(ast.Expression(value.value), '<string>', 'eval', flags)
+        # t-string interpolations record their exact source text, f-strings don't
+        expression = getattr(value, 'str', None) or ast.unparse(value.value)
+        conversion = None if value.conversion == -1 else chr(value.conversion)
+        if value.format_spec is None:
+            format_spec = ''
+        else:
+            format_spec = _parts(value.format_spec, flags)
+            if all(isinstance(part, str) for part in format_spec):
+                format_spec = ''.join(format_spec)
+        parts.append((code, expression, conversion, format_spec))
+    return tuple(parts)
+
+
+def render(parts, globals, locals, values=None):
+    """Evaluate each field of parsed f-template parts and join them into a str
+
+    When values is a dict, each distinct expression is only evaluated the
+    first time it is met and its value is remembered there for the others.
+    """
+    rendered = []
+    for part in parts:
+        if isinstance(part, str):
+            rendered.append(part)
+            continue
+        code, expression, conversion, format_spec = part
+        if values is None:
+            value = eval(code, globals, locals)
+        else:
+            value = _evaluate_once(code, expression, globals, locals, values)
+        if conversion is not None:
+            value = _CONVERTERS[conversion](value)
+        if not isinstance(format_spec, str):
+            format_spec = render(format_spec, globals, locals, values)
+        rendered.append(format(value, format_spec))
+    return ''.join(rendered)
+
+
+def render_timed(parts, globals, locals, timings, values=None):
+    """Like render(), but time each field
+
+    For every field, a tuple of its expression, the seconds spent evaluating
+    it and the seconds spent converting and formatting its value is appended
+    to timings. Fields of a format spec are timed before the field using it.
+    """
+    rendered = []
+    for part in parts:
+        if isinstance(part, str):
+            rendered.append(part)
+            continue
+        code, expression, conversion, format_spec = part
+        start = perf_counter()
+        if values is None:
+            value = eval(code, globals, locals)
+        else:
+            value = _evaluate_once(code, expression, globals, locals, values)
+        evaluated = perf_counter()
+        if conversion is not None:
+            value = _CONVERTERS[conversion](value)
+        converting = perf_counter() - evaluated
+        if not isinstance(format_spec, str):
+            format_spec = render_timed(format_spec, globals, locals, timings, values)
+        formatting = perf_counter()
+        rendered.append(format(value, format_spec))
+        format_seconds = converting + perf_counter() - formatting
+        timings.append((expression, evaluated - start, format_seconds))
+    return ''.join(rendered)
+
+
+def render_once(parts, globals, locals):
+    """Like render(), but evaluate repeated expressions only once"""
+    return render(parts, globals, locals, {})
+
+
+def stream(parts, globals, locals):
+    """Like render(), but yield each literal and formatted field as it is produced"""
+    for part in parts:
+        if isinstance(part, str):
+            if part:
+                yield part
+            continue
+        code, _, conversion, format_spec = part
+        value = eval(code, globals, locals)
+        if conversion is not None:
+            value = _CONVERTERS[conversion](value)
+        if not isinstance(format_spec, str):
+            format_spec = render(format_spec, globals, locals)
+        yield format(value, format_spec)
+
+
+def interpolate(parts, globals, locals, values=None):
+    """Evaluate each field of parsed t-template parts into a Template
+
+    values is used as in render().
+    """
+    args = []
+    for part in parts:
+        if isinstance(part, str):
+            args.append(part)
+            continue
+        code, expression, conversion, format_spec = part
+        if values is None:
+            value = eval(code, globals, locals)
+        else:
+            value = _evaluate_once(code, expression, globals, locals, values)
+        if not isinstance(format_spec, str):
+            format_spec = render(format_spec, globals, locals, values)
+        args.append(Interpolation(value, expression, conversion, format_spec))
+    return Template(*args)
+
+
+def interpolate_timed(parts, globals, locals, timings, values=None):
+    """Like interpolate(), but time each field as render_timed() does
+
+    Interpolations aren't formatted, so only their format specs' fields
+    take any time to format.
+    """
+    args = []
+    for part in parts:
+        if isinstance(part, str):
+            args.append(part)
+            continue
+        code, expression, conversion, format_spec = part
+        start = perf_counter()
+        if values is None:
+            value = eval(code, globals, locals)
+        else:
+            value = _evaluate_once(code, expression, globals, locals, values)
+        evaluated = perf_counter() - start
+        if not isinstance(format_spec, str):
+            format_spec = render_timed(format_spec, globals, locals, timings, values)
+        timings.append((expression, evaluated, 0.0))
+        args.append(Interpolation(value, expression, conversion, format_spec))
+    return Template(*args)
+
+
+def interpolate_once(parts, globals, locals):
+    """Like interpolate(), but evaluate repeated expressions only once"""
+    return interpolate(parts, globals, locals, {})
+
+
+def _evaluate_once(code, expression, globals, locals, values):
+    # keyed on source text; an f-string's is normalized by ast.unparse
+    try:
+        return values[expression]
+    except KeyError:
+        value = values[expression] = eval(code, globals, locals)
+        return value
@@ -0,0 +1,112 @@
+import sys
+import threading
+from collections import namedtuple
+
+from ._parse import interpolate_timed, render_timed
+
+ProfileEntry = namedtuple(
+    'ProfileEntry',
+    ['kind', 'template', 'expression', 'calls', 'eval_seconds', 'format_seconds'],
+)
+
+_SORT_KEYS = {
+    'total': lambda entry: entry.eval_seconds + entry.format_seconds,
+    'eval': lambda entry: entry.eval_seconds,
+    'format': lambda entry: entry.format_seconds,
+    'calls': lambda entry: entry.calls,
+    'per_call': lambda entry: (entry.eval_seconds + entry.format_seconds) / entry.calls,
+}
+
+# checked by f() and t() before every render, like _stats.enabled
+enabled = False
+_callback = None
+
+_lock = threading.Lock()
+# (kind, template, expression) -> [calls, eval seconds, format seconds]
+_totals = {}
+
+
+def renderer(kind, template, dedupe):
+    """Return a function rendering the parts of template that times and records each field"""
+    timed = render_timed if kind == 'f' else interpolate_timed
+
+    def render(parts, globals, locals):
+        timings = []
+        try:
+            return timed(parts, globals, locals, timings, {} if dedupe else None)
+        finally:
+            _record(kind, template, timings)
+
+    return render
+
+
+def _record(kind, template, timings):
+    with _lock:
+        for expression, eval_seconds, format_seconds in timings:
+            totals = _totals.get((kind, template, expression))
+            if totals is None:
+                totals = _totals[kind, template, expression] = [0, 0.0, 0.0]
+            totals[0] += 1
+            totals[1] += eval_seconds
+            totals[2] += format_seconds
+    if _callback is not None:
+        _callback(kind, template, tuple(timings))
+
+
+def enable_profile(enable: bool = True, *, callback=None) -> None:
+    """Start, or with False stop, timing every expression f() and t() evaluate
+
+    Profiled templates are rendered field by field, which is slower than usual.
+    If callback is given it is also called after each render with the kind
+    ('f' or 't'), the template and a tuple of (expression, eval seconds,
+    format seconds) for each of its fields in the order they finished.
+    """
+    global enabled, _callback
+    enabled = bool(enable)
+    _callback = callback if enabled else None
+
+
+def profile(sort: str = 'total') -> list:
+    """Return a ProfileEntry for each expression of each profiled template, slowest first"""
+    try:
+        key = _SORT_KEYS[sort]
+    except KeyError:
+        raise ValueError(
+            f'sort must be one of {", ".join(_SORT_KEYS)}, not {sort!r}'
+        ) from None
+    with _lock:
+        entries = [ProfileEntry(*name, *totals) for name, totals in _totals.items()]
+    entries.sort(key=key, reverse=True)
+    return entries
+
+
+def print_profile(sort: str = 'total', limit=None, file=None) -> None:
+    """Print the profiled expressions as a table, slowest first, like pstats"""
+    file = sys.stdout if file is None else file
+    entries = profile(sort)[:limit]
+    print(
+        f'{"calls":>9} {"eval (s)":>10} {"format (s)":>10} {"total (s)":>10} '
+        f'{"per call (s)":>12}  expression in template',
+        file=file,
+    )
+    for entry in entries:
+        total = entry.eval_seconds + entry.format_seconds
+        print(
+            f'{entry.calls:>9} {entry.eval_seconds:>10.6f} {entry.format_seconds:>10.6f} '
+            f'{total:>10.6f} {total / entry.calls:>12.9f}  '
+            f'{entry.expression} in {entry.kind}{_shorten(entry.template)}',
+            file=file,
+        )
+
+
+def _shorten(template, width=60):
+    shown = repr(template)
+    if len(shown) > width:
+        shown = shown[: width - 4] + '...' + shown[0]
+    return shown
+
+
+def reset_profile() -> None:
+    """Forget every expression profiled so far"""
+    with _lock:
+        _totals.clear()
@@ -0,0 +1,27 @@
+from string.templatelib import Template
+
+from ._parse import _CONVERTERS
+
+
+def render(template: Template, *, escape=None) -> str:
+    """Join a Template's strings and formatted interpolations into a str, as an f-string would
+
+    Each interpolation's conversion and format spec are applied to its value.
+    escape, if given, is then called with each formatted value, but never with
+    the literal strings, so it can quote values for HTML, a shell or SQL.
+    """
+    if not isinstance(template, Template):
+        raise TypeError(f'Cannot render {type(template)}')
+    strings = template.strings
+    rendered = []
+    for string, interpolation in zip(strings, template.interpolations):
+        rendered.append(string)
+        value = interpolation.value
+        if interpolation.conversion is not None:
+            value = _CONVERTERS[interpolation.conversion](value)
+        value = format(value, interpolation.format_spec)
+        if escape is not None:
+            value = escape(value)
+        rendered.append(value)
+    rendered.append(strings[-1])
+    return ''.join(rendered)
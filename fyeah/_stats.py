@@ -0,0 +1,42 @@
+from collections import namedtuple
+
+from ._counters import _Counters
+
+Stats = namedtuple(
+    'Stats',
+    [
+        'f_renders',
+        't_renders',
+        'repr_compiles',
+        'escape_compiles',
+        'compile_seconds',
+        'eval_seconds',
+        'cache_hits',
+        'cache_misses',
+    ],
+)
+
+# checked before any counting is done, so disabled stats cost one global lookup
+enabled = False
+
+_counters = _Counters(Stats._fields)
+
+
+def record(**amounts):
+    _counters.update(amounts)
+
+
+def enable_stats(enable: bool = True) -> None:
+    """Start, or with False stop, counting renders and timing compiles and evals"""
+    global enabled
+    enabled = bool(enable)
+
+
+def stats() -> Stats:
+    """Report what f() and t() have done since stats were last reset"""
+    return Stats(**_counters.totals())
+
+
+def reset_stats() -> None:
+    """Set all counters and timings back to zero"""
+    _counters.reset()
@@ -0,0 +1,40 @@
+from ._fyeah import _compile_template
+from ._namespace import resolve_namespaces
+from ._parse import parse, stream
+
+
+def iter_render(
+    template: str, namespace=None, /, *, globals=None, locals=None, depth=1, frame=None
+):
+    """Format template like f(), yielding each literal chunk and formatted value in turn
+
+    Names are looked up when this is called, but each expression is only
+    evaluated as the iterator reaches it.
+    """
+    if not isinstance(template, str):
+        raise TypeError(f'Cannot format {type(template)}')
+    # bind function locals as they are now, like f() would
+    globals, locals = resolve_namespaces(
+        namespace, globals, locals, depth, frame, bind=True
+    )
+    return stream(parse('f', template, _compile_template), globals, locals)
+
+
+def render_to(
+    template: str,
+    fp,
+    namespace=None,
+    /,
+    *,
+    globals=None,
+    locals=None,
+    depth=1,
+    frame=None,
+) -> None:
+    """Format template like f(), writing it to fp one piece at a time instead of all at once"""
+    if not isinstance(template, str):
+        raise TypeError(f'Cannot format {type(template)}')
+    globals, locals = resolve_namespaces(namespace, globals, locals, depth, frame)
+    write = fp.write
+    for chunk in stream(parse('f', template, _compile_template), globals, locals):
+        write(chunk)
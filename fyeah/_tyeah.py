@@ -1,16 +1,75 @@
-import inspect
 from string.templatelib import Template
+from time import perf_counter
 
+from . import _profile, _stats
+from ._cache import cached_compile, escaped_templates
 from ._escaping import escape
+from ._namespace import resolve_namespaces
+from ._parse import interpolate_once, parse
 
 
-def t(template: str) -> Template:
+def t(
+    template: str,
+    namespace=None,
+    /,
+    *,
+    globals=None,
+    locals=None,
+    dedupe=False,
+    depth=1,
+    frame=None,
+) -> Template:
     if not isinstance(template, str):
         raise TypeError(f'Cannot templatize {type(template)}')
-    parent_frame = inspect.stack()[1].frame
+    globals, locals = resolve_namespaces(namespace, globals, locals, depth, frame)
 
-    t = escape(template, 't')
-    templated = eval(t, parent_frame.f_globals, parent_frame.f_locals)
+    if _profile.enabled:
+        code = parse('t', template, _compile_template)
+        evaluate = _profile.renderer('t', template, dedupe)
+    elif dedupe:
+        # interpolate part by part, evaluating each distinct expression once
+        code = parse('t', template, _compile_template)
+        evaluate = interpolate_once
+    else:
+        code = _compile(template)
+        evaluate = eval
+    if _stats.enabled:
+        start = perf_counter()
+        templated = evaluate(code, globals, locals)
+        _stats.record(t_renders=1, eval_seconds=perf_counter() - start)
+    else:
+        templated = evaluate(code, globals, locals)
 
     assert isinstance(templated, Template)
     return templated
+
+
+def _compile(template):
+    return cached_compile('t', template, _compile_template)
+
+
+def _compile_template(template, flags=0):
+    return _compile_source(template, flags)[1]
+
+
+def _compile_source(template, flags=0):
+    """Return the t-string source for template along with its compiled code"""
+    # Interpolations keep their expression's source text, so only take the
+    # cheap path when repr() left the template untouched inside its quotes;
+    # otherwise the expressions would carry repr's escapes
+    t = 't' + repr(template)
+    if t[2:-1] == template and escaped_templates.get(('t', template)) is None:
+        try:
+            code = compile(t, '<string>', 'eval', flags)
+        except SyntaxError:
+            # don't try repr again next time
+            escaped_templates.put(('t', template), True)
+        else:
+            if _stats.enabled:
+                _stats.record(repr_compiles=1)
+            return t, code
+    t = escape(template, 't')
+    code = compile(t, '<string>', 'eval', flags)
+    if _stats.enabled:
+        _stats.record(escape_compiles=1)
+    return t, code
@@ -0,0 +1,130 @@
+import builtins
+import inspect
+import logging
+from collections import ChainMap
+
+from ._fyeah import _compile
+
+
+class FStyle(logging.PercentStyle):
+    """A logging format style that renders the format string as an f-template against the record"""
+
+    default_format = '{message}'
+    asctime_format = '{asctime}'
+    asctime_search = '{asctime'
+
+    def __init__(self, fmt, *, defaults=None):
+        super().__init__(fmt, defaults=defaults)
+        self._code = None
+        self._globals = {'__builtins__': builtins}
+
+    def validate(self):
+        try:
+            self._code = _compile(self._fmt)
+        except SyntaxError as e:
+            raise ValueError(
+                f'Invalid format {self._fmt!r} for fyeah style: {e}'
+            ) from None
+
+    def _format(self, record):
+        if self._code is None:
+            self._code = _compile(self._fmt)
+        if defaults := self._defaults:
+            values = ChainMap(record.__dict__, defaults)
+        else:
+            values = record.__dict__
+        return eval(self._code, self._globals, values)
+
+    def format(self, record):
+        try:
+            return self._format(record)
+        except NameError as e:
+            raise ValueError(f'Formatting field not found in record: {e.name!r}') from e
+
+
+class Formatter(logging.Formatter):
+    """A logging.Formatter whose format string is an f-template
+
+    Messages logged through a TemplateAdapter are rendered here with the
+    record's attributes available alongside the caller's variables. The
+    format string is always an f-template: style is accepted so the signature
+    matches logging.Formatter for logging.config, which passes '%' unless told
+    otherwise, but any of the stdlib styles is ignored.
+    """
+
+    def __init__(
+        self, fmt=None, datefmt=None, style='{', validate=True, *, defaults=None
+    ):
+        if style not in logging._STYLES:
+            raise ValueError(
+                f'Style must be one of: {",".join(logging._STYLES.keys())}'
+            )
+        super().__init__(datefmt=datefmt, validate=False, defaults=defaults)
+        self._style = FStyle(fmt, defaults=defaults)
+        if validate:
+            self._style.validate()
+        self._fmt = self._style._fmt
+
+    def format(self, record):
+        msg = record.msg
+        if not isinstance(msg, Message):
+            return super().format(record)
+        record.msg = msg.render(record)
+        try:
+            return super().format(record)
+        finally:
+            record.msg = msg
+
+
+class Message:
+    """A log message f-template bound to the variables of the code that logged it
+
+    Only the fyeah Formatter can add the record's attributes; any other
+    formatter renders it with the caller's variables alone.
+    """
+
+    __slots__ = ('_globals', '_locals', 'template')
+
+    def __init__(self, template, globals, locals):
+        self.template = template
+        self._globals = globals
+        self._locals = locals
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.template!r})'
+
+    def __str__(self):
+        return eval(_compile(self.template), self._globals, self._locals)
+
+    def render(self, record):
+        """Render with the record's attributes behind the caller's own variables"""
+        values = ChainMap(self._locals, record.__dict__)
+        return eval(_compile(self.template), self._globals, values)
+
+
+class TemplateAdapter(logging.LoggerAdapter):
+    """Wrap a logger so that string messages are f-templates rendered only when emitted"""
+
+    def process(self, msg, kwargs):
+        if isinstance(msg, str):
+            msg = Message(msg, *_caller_namespace())
+        return super().process(msg, kwargs)
+
+
+def _caller_namespace():
+    frame = inspect.currentframe()
+    while frame.f_code.co_filename in _INTERNAL_FILES:
+        frame = frame.f_back
+    globals, locals = frame.f_globals, frame.f_locals
+    if locals is not globals:
+        # the record may be emitted later, bind function locals as they are now
+        locals = dict(locals)
+    return globals, locals
+
+
+_INTERNAL_FILES = frozenset(
+    (
+        logging.LoggerAdapter.log.__code__.co_filename,
+        _caller_namespace.__code__.co_filename,
+    )
+)
@@ -8,6 +8,12 @@ def unittest(session):
     session.run('pytest', *session.posargs)
 
 
+@nox.session(python=['3.14'])
+def bench(session):
+    session.install('.')
+    session.run('python', 'bench/suite.py', *session.posargs)
+
+
 @nox.session
 def format(session):
     session.install('ruff')
@@ -0,0 +1,94 @@
+import asyncio
+import time
+from string.templatelib import Template
+
+import pytest
+
+from fyeah import af, at, f
+
+
+# ruff: noqa: F841
+
+name = 'foo'
+
+
+async def fetch(value, delay=0.0):
+    await asyncio.sleep(delay)
+    return value
+
+
+def test_no_awaits():
+    count = 3
+    assert asyncio.run(af('{name} {count:>3}')) == 'foo   3'
+
+
+def test_matches_f():
+    async def render():
+        uid = 7
+        return await af('{await fetch(uid)!r:>{await fetch(4)}} {name=} {uid}')
+
+    uid = 7
+    assert asyncio.run(render()) == f('{uid!r:>{4}} {name=} {uid}')
+
+
+def test_concurrent():
+    async def render():
+        start = time.perf_counter()
+        rendered = await af(
+            '{await fetch("a", 0.2)} {await fetch("b", 0.2)} {await fetch("c", 0.2)}'
+        )
+        return rendered, time.perf_counter() - start
+
+    rendered, elapsed = asyncio.run(render())
+    assert rendered == 'a b c'
+    assert elapsed < 0.5
+
+
+def test_namespace():
+    rendered = asyncio.run(af('{await fetch(user)}', {'user': 'ada', 'fetch': fetch}))
+    assert rendered == 'ada'
+
+
+def test_error_cancels_others():
+    finished = []
+
+    async def slow():
+        await asyncio.sleep(0.5)
+        finished.append(True)
+
+    async def fail():
+        raise KeyError('boom')
+
+    async def render():
+        with pytest.raises(KeyError):
+            await af('{await slow()} {await fail()}', {'slow': slow, 'fail': fail})
+        await asyncio.sleep(0.6)
+
+    asyncio.run(render())
+    assert finished == []
+
+
+def test_sync_error_closes_awaitables():
+    async def render():
+        await af('{await fetch(1)} {1 / 0}')
+
+    with pytest.raises(ZeroDivisionError):
+        asyncio.run(render())
+
+
+def test_at():
+    async def render():
+        user = 'ada'
+        return await at('{await fetch(user)!r:>{await fetch(5)}} and {name}')
+
+    rendered = asyncio.run(render())
+    assert isinstance(rendered, Template)
+    assert rendered.strings == ('', ' and ', '')
+    first, second = rendered.interpolations
+    assert (first.value, first.expression, first.conversion, first.format_spec) == (
+        'ada',
+        'await fetch(user)',
+        'r',
+        '5',
+    )
+    assert (second.value, second.expression) == ('foo', 'name')
@@ -0,0 +1,157 @@
+import threading
+
+import pytest
+
+import fyeah
+import fyeah._cache
+import fyeah._fyeah
+from fyeah import f, t
+from fyeah._cache import DEFAULT_MAXSIZE, _LRUCache
+
+
+# ruff: noqa: F841
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    fyeah.set_cache_size(DEFAULT_MAXSIZE)
+    fyeah.cache_clear()
+    yield
+    fyeah.set_cache_size(DEFAULT_MAXSIZE)
+    fyeah.cache_clear()
+
+
+def test_repeat_render_hits_cache():
+    value = 1
+    assert f('{value}') == '1'
+    assert fyeah.cache_info() == (0, 1, DEFAULT_MAXSIZE, 1)
+    value = 2
+    assert f('{value}') == '2'
+    assert fyeah.cache_info() == (1, 1, DEFAULT_MAXSIZE, 1)
+
+
+def test_escaped_template_cached():
+    template = '{"\t"}'
+    assert f(template) == '\t'
+    assert f(template) == '\t'
+    assert fyeah.cache_info().hits == 1
+
+
+def test_t_cached_separately():
+    value = 1
+    f('{value}')
+    assert t('{value}').interpolations[0].value == 1
+    assert t('{value}').interpolations[0].value == 1
+    assert fyeah.cache_info() == (1, 2, DEFAULT_MAXSIZE, 2)
+
+
+@pytest.fixture
+def compiles(monkeypatch):
+    """Record the source of every compile() done by fyeah._fyeah"""
+    sources = []
+
+    def counting_compile(*args):
+        sources.append(args[0])
+        return compile(*args)
+
+    monkeypatch.setattr(fyeah._fyeah, 'compile', counting_compile, raising=False)
+    return sources
+
+
+def test_syntax_error_cached_apart():
+    for _ in range(2):
+        with pytest.raises(SyntaxError):
+            f('{')
+    assert fyeah.cache_info().currsize == 0
+    assert fyeah._cache.error_cache.info().currsize == 1
+
+
+def test_syntax_error_remembered(compiles):
+    with pytest.raises(SyntaxError) as first:
+        f('{pass}')
+    assert len(compiles) == 2
+    with pytest.raises(SyntaxError) as second:
+        f('{pass}')
+    assert len(compiles) == 2
+    assert second.value is not first.value
+    assert (second.value.msg, second.value.offset) == (
+        first.value.msg,
+        first.value.offset,
+    )
+    fyeah.cache_clear()
+    with pytest.raises(SyntaxError):
+        f('{pass}')
+    assert len(compiles) == 4
+
+
+def test_escape_remembered(compiles):
+    assert f('{None\n}') == 'None'
+    assert len(compiles) == 2
+    # evicted from the code cache, but the escaping it needs is still known
+    fyeah._cache.code_cache.clear()
+    assert f('{None\n}') == 'None'
+    assert len(compiles) == 3
+    assert not compiles[-1].startswith("f'{None\\n}")
+
+
+def test_cache_clear():
+    f('')
+    fyeah.cache_clear()
+    assert fyeah.cache_info() == (0, 0, DEFAULT_MAXSIZE, 0)
+
+
+def test_cache_disabled():
+    fyeah.set_cache_size(0)
+    assert f('') == ''
+    assert f('') == ''
+    assert fyeah.cache_info() == (0, 2, 0, 0)
+
+
+@pytest.mark.parametrize('size', [-1, 1.5, None, True])
+def test_bad_cache_size(size):
+    with pytest.raises((TypeError, ValueError)):
+        fyeah.set_cache_size(size)
+
+
+def test_lru_eviction():
+    cache = _LRUCache(2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1
+    cache.put('c', 3)
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+
+
+def test_resize_evicts():
+    cache = _LRUCache(3)
+    for key in 'abc':
+        cache.put(key, key)
+    cache.resize(1)
+    assert cache.info().currsize == 1
+    assert cache.get('c') == 'c'
+
+
+def test_cache_concurrent_renders():
+    cache = _LRUCache(4)
+    errors = []
+
+    def churn(offset):
+        try:
+            for number in range(500):
+                key = (offset + number) % 10
+                if cache.get(key) is None:
+                    cache.put(key, key)
+                assert f('{number}', {'number': number}) == str(number)
+        except Exception as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=churn, args=(offset,)) for offset in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert cache.info().currsize <= 4
+    assert sum(cache.info()[:2]) == 8 * 500
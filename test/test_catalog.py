@@ -0,0 +1,118 @@
+import json
+
+import pytest
+
+from fyeah import Catalog
+
+# ruff: noqa: F841
+
+name = 'foo'
+
+
+def test_mapping():
+    catalog = Catalog({'greet': 'hello {name}'})
+    assert catalog['greet'] == 'hello {name}'
+    assert list(catalog) == ['greet']
+    assert len(catalog) == 1
+    assert 'greet' in catalog
+
+
+def test_render_caller_scope():
+    catalog = Catalog({'shipped': 'order {order_id} shipped to {name}'})
+    order_id = 12
+    assert catalog.f('shipped') == 'order 12 shipped to foo'
+    template = catalog.t('shipped')
+    assert template.values == (12, 'foo')
+
+
+def test_render_namespace():
+    catalog = Catalog({'shipped': 'order {order_id}'})
+    assert catalog.f('shipped', {'order_id': 3}) == 'order 3'
+
+
+def test_directory(tmp_path):
+    (tmp_path / 'order_shipped.txt').write_text('order {order_id} shipped')
+    (tmp_path / 'welcome').write_text('welcome {name}\n')
+    (tmp_path / '.hidden').write_text('{')
+    catalog = Catalog.from_path(tmp_path)
+    assert sorted(catalog) == ['order_shipped', 'welcome']
+    order_id = 1
+    assert catalog.f('order_shipped') == 'order 1 shipped'
+    assert catalog.f('welcome') == 'welcome foo\n'
+
+
+def test_directory_duplicate_names(tmp_path):
+    (tmp_path / 'welcome.txt').write_text('welcome {name}')
+    (tmp_path / 'welcome.html').write_text('<p>welcome {name}</p>')
+    with pytest.raises(ValueError, match='welcome'):
+        Catalog.from_path(tmp_path)
+
+
+def test_directory_read_lazily(tmp_path):
+    (tmp_path / 'later.txt').write_text('first')
+    catalog = Catalog.from_path(tmp_path)
+    assert 'later' in catalog
+    (tmp_path / 'later.txt').write_text('second')
+    assert catalog['later'] == 'second'
+
+
+def test_toml(tmp_path):
+    path = tmp_path / 'catalog.toml'
+    path.write_text('top = "{name}"\n[email]\nsubject = "hi {name!r}"\n')
+    catalog = Catalog.from_path(path)
+    assert catalog.f('top') == 'foo'
+    assert catalog.f('email.subject') == "hi 'foo'"
+
+
+def test_json(tmp_path):
+    path = tmp_path / 'catalog.json'
+    path.write_text(json.dumps({'a': {'b': '{name}é'}}))
+    assert Catalog.from_path(path).f('a.b') == 'fooé'
+
+
+def test_bad_sources(tmp_path):
+    path = tmp_path / 'catalog.yaml'
+    path.write_text('')
+    with pytest.raises(ValueError):
+        Catalog.from_path(path)
+    path = tmp_path / 'catalog.json'
+    path.write_text('{"count": 1}')
+    with pytest.raises(TypeError):
+        Catalog.from_path(path)
+
+
+def test_colliding_names(tmp_path):
+    path = tmp_path / 'catalog.json'
+    path.write_text(json.dumps({'a.b': 'x', 'a': {'b': 'y'}}))
+    with pytest.raises(ValueError, match="'a.b'"):
+        Catalog.from_path(path)
+
+
+def test_warm():
+    catalog = Catalog({str(number): f'{{{number}}}' for number in range(20)})
+    catalog.warm(kinds=('f', 't'), max_workers=4)
+    assert len(catalog._compiled) == 40
+    assert catalog.f('7') == '7'
+
+
+def test_warm_errors():
+    with pytest.raises(SyntaxError):
+        Catalog({'bad': '{'}).warm()
+    with pytest.raises(ValueError):
+        Catalog({}).warm(kinds=('x',))
+
+
+def test_missing():
+    with pytest.raises(KeyError):
+        Catalog({}).f('nope')
+
+
+def test_render_depth():
+    catalog = Catalog({'order': 'order {order_id}'})
+
+    def wrapper():
+        order_id = 'wrapper'
+        return catalog.f('order', depth=2)
+
+    order_id = 5
+    assert wrapper() == 'order 5'
@@ -0,0 +1,107 @@
+import pickle
+from string.templatelib import Template
+
+import pytest
+
+import fyeah
+from fyeah import compile
+
+
+# ruff: noqa: F841
+
+name = 'foo'
+
+
+def test_render_caller_scope():
+    bad_check = compile('expected an integer, got {type(value).__name__} instead')
+    value = 'x'
+    assert bad_check.render() == 'expected an integer, got str instead'
+    value = 1.0
+    assert bad_check.render() == 'expected an integer, got float instead'
+
+
+def test_render_globals():
+    assert compile('{name}').render() == 'foo'
+
+
+def test_render_depth():
+    template = compile('{name}')
+
+    def wrapper():
+        name = 'wrapper'
+        return template.render(depth=2)
+
+    name = 'caller'
+    assert wrapper() == 'caller'
+
+
+def test_render_with():
+    greeting = compile('hello {who}')
+    assert greeting.render_with({'who': 'world'}) == 'hello world'
+    assert greeting.render_with(locals={'who': 'you'}) == 'hello you'
+
+
+def test_render_escaped():
+    assert compile('{"\t"}').render() == '\t'
+
+
+def test_render_t():
+    template = compile('hello {who!r:>8}', kind='t')
+    rendered = template.render_with({'who': 'world'})
+    assert isinstance(rendered, Template)
+    assert rendered.strings == ('hello ', '')
+    (interpolation,) = rendered.interpolations
+    assert interpolation.value == 'world'
+    assert interpolation.expression == 'who'
+    assert interpolation.conversion == 'r'
+    assert interpolation.format_spec == '>8'
+
+
+def test_compile_once():
+    template = compile('{name}')
+    fyeah.cache_clear()
+    template.render()
+    template.render()
+    assert fyeah.cache_info().misses == 0
+
+
+def test_compile_errors():
+    with pytest.raises(SyntaxError):
+        compile('{')
+    with pytest.raises(TypeError):
+        compile(b'{name}')
+    with pytest.raises(ValueError):
+        compile('{name}', kind='b')
+
+
+def test_pickle():
+    template = pickle.loads(pickle.dumps(compile('{who}', kind='f')))
+    assert template.render_with({'who': 'me'}) == 'me'
+    assert repr(template) == "fyeah.compile('{who}', kind='f')"
+
+
+def test_render_many():
+    rows = [{'user': 'ada', 'n': 1}, {'user': 'bob', 'n': 22}]
+    assert list(fyeah.render_many('{user:>4}|{n:03}', rows)) == [' ada|001', ' bob|022']
+
+
+def test_render_many_lazy():
+    def rows():
+        yield {'x': 1}
+        raise AssertionError('read too far')
+
+    rendered = compile('{x}').render_many(rows())
+    assert next(rendered) == '1'
+
+
+def test_render_many_t():
+    (first, second) = fyeah.render_many('{x}', [{'x': 1}, {'x': 2}], kind='t')
+    assert first.values == (1,)
+    assert second.values == (2,)
+
+
+def test_render_many_errors():
+    with pytest.raises(SyntaxError):
+        fyeah.render_many('{', [])
+    with pytest.raises(NameError):
+        list(fyeah.render_many('{y}', [{'x': 1}]))
@@ -0,0 +1,29 @@
+import threading
+
+from fyeah._counters import _Counters
+
+
+def test_counts():
+    counters = _Counters(('a', 'b'))
+    counters.add('a')
+    counters.update({'a': 2, 'b': 0.5})
+    assert counters.totals() == {'a': 3, 'b': 0.5}
+    counters.reset()
+    assert counters.totals() == {'a': 0, 'b': 0}
+
+
+def test_threads_summed():
+    counters = _Counters(('hits',))
+
+    def count():
+        for _ in range(1000):
+            counters.add('hits')
+
+    threads = [threading.Thread(target=count) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    counters.add('hits')
+    assert counters.totals() == {'hits': 8001}
+    assert len(counters._per_thread) == 1
@@ -0,0 +1,76 @@
+import os
+import sys
+
+import pytest
+
+import fyeah
+from fyeah import _diskcache, _fyeah, f
+from fyeah._diskcache import _DiskCache
+
+
+# ruff: noqa: F841
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    fyeah.cache_clear()
+    fyeah.set_cache_dir(tmp_path)
+    yield tmp_path / sys.implementation.cache_tag
+    fyeah.set_cache_dir(None)
+    fyeah.cache_clear()
+
+
+def test_store_and_load(cache_dir, monkeypatch):
+    value = 1
+    assert f('{value}') == '1'
+    (entry,) = os.listdir(cache_dir)
+    assert entry.endswith('.fyc')
+
+    fyeah.cache_clear()
+    # prove the code came from disk by making compiling impossible
+    monkeypatch.setattr(_fyeah, '_compile_template', None)
+    value = 2
+    assert f('{value}') == '2'
+
+
+def test_f_and_t_stored_separately(cache_dir):
+    disk = _diskcache.disk_cache
+    code = compile('1', '<string>', 'eval')
+    disk.store('f', '{x}', code)
+    assert disk.load('t', '{x}') is None
+    assert eval(disk.load('f', '{x}')) == 1
+
+
+def test_corrupt_entry_ignored(cache_dir):
+    disk = _diskcache.disk_cache
+    disk.store('f', '{x}', compile('1', '<string>', 'eval'))
+    (entry,) = os.listdir(cache_dir)
+    (cache_dir / entry).write_bytes(b'garbage')
+    assert disk.load('f', '{x}') is None
+    (cache_dir / entry).write_bytes(b'')
+    assert disk.load('f', '{x}') is None
+
+
+def test_eviction(tmp_path):
+    disk = _DiskCache(tmp_path, max_bytes=0)
+    disk.store('f', '{x}', compile('1', '<string>', 'eval'))
+    assert os.listdir(disk.directory) == []
+
+
+def test_eviction_oldest_first(tmp_path):
+    disk = _DiskCache(tmp_path)
+    code = compile('1', '<string>', 'eval')
+    for number in range(3):
+        disk.store('f', str(number), code)
+        path = disk._path('f', str(number))
+        os.utime(path, (number, number))
+    disk.max_bytes = os.path.getsize(path) * 2
+    disk._evict()
+    assert disk.load('f', '0') is None
+    assert disk.load('f', '1') is not None
+    assert disk.load('f', '2') is not None
+
+
+def test_disabled():
+    fyeah.set_cache_dir(None)
+    assert _diskcache.disk_cache is None
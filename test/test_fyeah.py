@@ -329,3 +329,101 @@ def test_fstring_expr_errors(error):
 def test_not_in_format(template, final):
     d = {'key': 'door'}
     assert f(template) == final
+
+
+def test_namespace_mapping():
+    row = {'name': 'bar', 'count': 2}
+    assert f('{name} x{count}', row) == 'bar x2'
+    assert row == {'name': 'bar', 'count': 2}
+
+
+def test_namespace_builtins_available():
+    assert f('{len(name)}', {'name': 'bar'}) == '3'
+
+
+def test_namespace_not_leaked():
+    with pytest.raises(NameError):
+        f('{outside}', {'name': 'bar'})
+
+
+def test_globals_and_locals():
+    assert f('{name}{outside}', globals={'name': 'g'}, locals={'outside': 'l'}) == 'gl'
+    assert f('{name}', globals={'name': 'g'}) == 'g'
+    assert f('{name}', locals={'name': 'l'}) == 'l'
+
+
+def test_namespace_with_globals_error():
+    with pytest.raises(TypeError):
+        f('{name}', {'name': 'bar'}, globals={})
+
+
+def test_namespace_skips_stack(monkeypatch):
+    import inspect
+
+    def no_stack(*args, **kwargs):
+        raise AssertionError('stack was inspected')
+
+    monkeypatch.setattr(inspect, 'stack', no_stack)
+    assert f('{name}', {'name': 'bar'}) == 'bar'
+
+
+def test_long_escaped_template():
+    template = 'it\'s "{name}" {"\t"}\n' * 5000
+    assert f(template) == 'it\'s "foo" \t\n' * 5000
+
+
+def test_dedupe():
+    calls = []
+
+    def summary():
+        calls.append(None)
+        return 'ok'
+
+    assert f('{summary()} {summary()!r:>6} {summary()=}', dedupe=True) == "ok   'ok' summary()='ok'"
+    assert len(calls) == 1
+    assert f('{summary()} {summary()}') == 'ok ok'
+    assert len(calls) == 3
+
+
+def test_dedupe_format_spec():
+    calls = []
+
+    def width():
+        calls.append(None)
+        return 4
+
+    assert f('{name:>{width()}}|{width()}', dedupe=True) == ' foo|4'
+    assert len(calls) == 1
+
+
+def test_depth():
+    def wrapper(template):
+        name = 'wrapper'
+        return f(template, depth=2)
+
+    name = 'caller'
+    assert wrapper('{name}') == 'caller'
+    with pytest.raises(ValueError):
+        f('{name}', depth=0)
+
+
+def test_frame():
+    import sys
+
+    def wrapper(template, frame):
+        return f(template, frame=frame)
+
+    name = 'caller'
+    assert wrapper('{name}', sys._getframe()) == 'caller'
+    with pytest.raises(TypeError):
+        f('{name}', {'name': 'bar'}, frame=sys._getframe())
+
+
+def test_caller_not_from_stack(monkeypatch):
+    import inspect
+
+    def no_stack(*args, **kwargs):
+        raise AssertionError('stack was inspected')
+
+    monkeypatch.setattr(inspect, 'stack', no_stack)
+    assert f('{name}') == 'foo'
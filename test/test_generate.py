@@ -0,0 +1,110 @@
+import warnings
+
+import pytest
+
+from fyeah.__main__ import main
+from fyeah._generate import generate, load_templates
+
+
+def load(source):
+    module = {}
+    exec(compile(source, '<generated>', 'exec'), module)
+    return module
+
+
+def test_generate():
+    module = load(generate({'greet': 'hello {name}, you have {len(items)} items'}))
+    assert module['greet'](name='ada', items=[1, 2]) == 'hello ada, you have 2 items'
+    assert module['__doc__'].startswith('Templates compiled by')
+
+
+def test_source_in_docstring():
+    for source in ('C:\\templates\\new.toml', 'odd"""name.json', "it's.toml"):
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            module = load(generate({}, source=source))
+        assert source in module['__doc__']
+
+
+def test_free_names():
+    module = load(
+        generate(
+            {
+                'nested': '{[i * scale for i in values]} {(lambda x: x + offset)(1)}',
+                'walrus': '{(w := 3)} {w}',
+                'constant': '{{literal}}',
+            }
+        )
+    )
+    assert module['nested'](scale=2, values=[1, 2], offset=1) == '[2, 4] 2'
+    assert module['walrus']() == '3 3'
+    assert module['constant']() == '{literal}'
+
+
+def test_builtin_names():
+    module = load(generate({'show': '{id} {len(items)}'}))
+    assert module['show'](id='abc', items=[1]) == 'abc 1'
+    assert module['show'](items=[]).startswith('<built-in function id>')
+
+
+def test_template_named_like_builtin():
+    module = load(generate({'len': 'L', 'count': '{len(items)}'}))
+    assert module['len']() == 'L'
+    assert module['count'](items=[1, 2]) == '2'
+    with pytest.raises(ValueError, match="'builtins'"):
+        generate({'builtins': 'b', 'count': '{len(items)}'})
+
+
+def test_escaped_template():
+    module = load(generate({'tab': '{"\t"} {name # comment\n}'}))
+    assert module['tab'](name='ada') == '\t ada'
+
+
+def test_function_names():
+    module = load(generate({'email.subject': 'a', '2fast': 'b', 'class': 'c'}))
+    assert module['email_subject']() == 'a'
+    assert module['_2fast']() == 'b'
+    assert module['class_']() == 'c'
+    with pytest.raises(ValueError):
+        generate({'a.b': '', 'a-b': ''})
+
+
+def test_invalid():
+    with pytest.raises(ValueError, match="'broken'"):
+        generate({'broken': '{'})
+    with pytest.raises(ValueError):
+        generate({}, kind='x')
+
+
+def test_load_module(tmp_path):
+    path = tmp_path / 'messages.py'
+    path.write_text('GREET = "hi {name}"\n_PRIVATE = "{x}"\nCOUNT = 3\n')
+    assert load_templates(str(path)) == {'GREET': 'hi {name}'}
+    assert load_templates('string')['digits'] == '0123456789'
+
+
+def test_main(tmp_path, capsys):
+    catalog = tmp_path / 'messages.json'
+    catalog.write_text('{"order": {"shipped": "order {order_id} shipped"}}')
+    output = tmp_path / 'messages_out.py'
+    main(['compile', str(catalog), '-o', str(output)])
+    module = load(output.read_text())
+    assert module['order_shipped'](order_id=4) == 'order 4 shipped'
+
+    main(['compile', str(catalog)])
+    assert capsys.readouterr().out == output.read_text()
+
+
+def test_main_error(tmp_path, capsys):
+    catalog = tmp_path / 'messages.json'
+    catalog.write_text('{"bad": "{"}')
+    with pytest.raises(SystemExit) as exit:
+        main(['compile', str(catalog)])
+    assert exit.value.code == 1
+    assert "'bad'" in capsys.readouterr().err
+
+
+def test_generate_t():
+    module = load(generate({'unlock': 'unlock {d["key"]!r}'}, kind='t'))
+    (interpolation,) = module['unlock'](d={'key': 'door'}).interpolations
+    assert (interpolation.value, interpolation.expression) == ('door', 'd["key"]')
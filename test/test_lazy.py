@@ -0,0 +1,66 @@
+import logging
+
+import pytest
+
+from fyeah import lazy
+
+
+# ruff: noqa: F841
+
+name = 'foo'
+
+
+def test_str():
+    value = 1
+    message = lazy('{name} {value}')
+    assert str(message) == 'foo 1'
+    assert f'{message:>7}' == '  foo 1'
+
+
+def test_locals_bound_at_creation():
+    value = 1
+    message = lazy('{value}')
+    value = 2
+    assert str(message) == '1'
+
+
+def test_evaluated_once():
+    calls = []
+    message = lazy('{calls.append(1)}')
+    str(message)
+    str(message)
+    assert calls == [1]
+
+
+def test_not_evaluated_until_used():
+    message = lazy('{1 / 0}')
+    with pytest.raises(ZeroDivisionError):
+        str(message)
+
+
+def test_namespace():
+    assert str(lazy('{name}', {'name': 'bar'})) == 'bar'
+
+
+def test_disabled_log_level_skips_render(caplog):
+    log = logging.getLogger('fyeah.test')
+    calls = []
+    with caplog.at_level(logging.INFO, logger='fyeah.test'):
+        log.debug(lazy('{calls.append("debug")}'))
+        log.info(lazy('{calls.append("info")}'))
+    assert calls == ['info']
+    assert caplog.messages == ['None']
+
+
+def test_type_error():
+    with pytest.raises(TypeError):
+        lazy(None)
+
+
+def test_depth():
+    def wrapper(template):
+        name = 'wrapper'
+        return lazy(template, depth=2)
+
+    name = 'caller'
+    assert str(wrapper('{name}')) == 'caller'
@@ -0,0 +1,110 @@
+import io
+import logging
+import logging.config
+
+import pytest
+
+from fyeah.logging import Formatter, Message, TemplateAdapter
+
+# ruff: noqa: F841
+
+name = 'foo'
+
+
+@pytest.fixture
+def logger():
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(Formatter('{levelname:<5}|{name}|{message}'))
+    # not registered with getLogger, so no other test handlers get attached
+    log = logging.Logger('fyeah.test_logging', logging.INFO)
+    log.addHandler(handler)
+    return log, stream
+
+
+def test_formatter_style(logger):
+    log, stream = logger
+    log.info('plain %s', 'args')
+    assert stream.getvalue() == 'INFO |fyeah.test_logging|plain args\n'
+
+
+def test_formatter_expressions():
+    formatter = Formatter('{levelname[0]}{lineno:04}{name.upper()!r}')
+    record = logging.makeLogRecord({'levelname': 'WARNING', 'lineno': 12, 'name': 'x'})
+    assert formatter.format(record) == "W0012'X'"
+
+
+def test_formatter_defaults():
+    formatter = Formatter('{message} {user}', defaults={'user': 'nobody'})
+    record = logging.makeLogRecord({'msg': 'hi'})
+    assert formatter.format(record) == 'hi nobody'
+    record = logging.makeLogRecord({'msg': 'hi', 'user': 'ada'})
+    assert formatter.format(record) == 'hi ada'
+
+
+def test_formatter_uses_time():
+    assert Formatter('{asctime} {message}').usesTime()
+    assert not Formatter().usesTime()
+
+
+def test_formatter_errors():
+    with pytest.raises(ValueError):
+        Formatter('{levelname')
+    formatter = Formatter('{missing}')
+    with pytest.raises(ValueError):
+        formatter.format(logging.makeLogRecord({}))
+
+
+def test_formatter_style_argument():
+    record = logging.makeLogRecord({'msg': 'hi'})
+    assert Formatter('{msg}', None, '%').format(record) == 'hi'
+    with pytest.raises(ValueError):
+        Formatter('{msg}', style='!')
+
+
+@pytest.mark.parametrize('validate', [{}, {'validate': True}])
+def test_formatter_dict_config(validate):
+    # the call logging.config.dictConfig() makes, without configuring any loggers
+    configurator = logging.config.DictConfigurator({})
+    formatter = configurator.configure_formatter(
+        {'class': 'fyeah.logging.Formatter', 'format': '{levelname}|{msg}', **validate}
+    )
+    assert isinstance(formatter, Formatter)
+    record = logging.makeLogRecord({'msg': 'hi', 'levelname': 'INFO'})
+    assert formatter.format(record) == 'INFO|hi'
+
+
+def test_adapter_caller_variables(logger):
+    log, stream = logger
+    adapter = TemplateAdapter(log)
+    user = 'ada'
+    adapter.info('{user} logged in at level {levelname}')
+    assert stream.getvalue() == 'INFO |fyeah.test_logging|ada logged in at level INFO\n'
+
+
+def test_adapter_caller_wins(logger):
+    log, stream = logger
+    name = 'shadow'
+    TemplateAdapter(log).warning('{name}')
+    assert stream.getvalue().endswith('|shadow\n')
+
+
+def test_adapter_filtered_not_rendered(logger):
+    log, stream = logger
+    calls = []
+    adapter = TemplateAdapter(log)
+    log.addFilter(lambda record: False)
+    try:
+        adapter.info('{calls.append(1)}')
+    finally:
+        log.filters.clear()
+    adapter.debug('{calls.append(2)}')
+    assert calls == []
+    assert stream.getvalue() == ''
+
+
+def test_message_plain_formatter():
+    user = 'ada'
+    message = Message('{user}', globals(), {'user': user})
+    record = logging.makeLogRecord({'msg': message})
+    assert logging.Formatter().format(record) == 'ada'
@@ -0,0 +1,39 @@
+import pytest
+
+import fyeah
+
+
+def test_in_order():
+    rows = [{'number': number} for number in range(50)]
+    rendered = fyeah.parallel_render('#{number:03}', rows, workers=2, chunksize=3)
+    assert list(rendered) == [f'#{number:03}' for number in range(50)]
+
+
+def test_iterator_rows():
+    rows = ({'number': number} for number in range(10))
+    assert list(fyeah.parallel_render('{number * 2}', rows, workers=1)) == [
+        str(number * 2) for number in range(10)
+    ]
+
+
+def test_no_rows():
+    assert list(fyeah.parallel_render('{number}', [], workers=1)) == []
+
+
+def test_row_error():
+    rendered = fyeah.parallel_render(
+        '{number}', [{'number': 1}, {}], workers=1, chunksize=1
+    )
+    assert next(rendered) == '1'
+    with pytest.raises(NameError):
+        next(rendered)
+
+
+def test_bad_template():
+    with pytest.raises(SyntaxError):
+        fyeah.parallel_render('{', [])
+
+
+def test_bad_chunksize():
+    with pytest.raises(ValueError):
+        fyeah.parallel_render('{number}', [], chunksize=0)
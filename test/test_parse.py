@@ -0,0 +1,71 @@
+import pytest
+
+from fyeah import f, t
+from fyeah._fyeah import _compile_template as compile_f
+from fyeah._parse import interpolate, parse, render
+from fyeah._tyeah import _compile_template as compile_t
+
+NAMESPACE = {'name': 'foo', 'count': 3, 'ratio': 0.5, 'd': {'key': 'door'}, 'width': 6}
+
+
+def test_split():
+    (literal, field) = parse('f', 'value: {name!r:>{width}}', compile_f)
+    assert literal == 'value: '
+    code, expression, conversion, format_spec = field
+    assert eval(code, {}, NAMESPACE) == 'foo'
+    assert expression == 'name'
+    assert conversion == 'r'
+    assert format_spec[0] == '>'
+    assert format_spec[1][1] == 'width'
+
+
+def test_constant_spec_joined():
+    ((_, _, _, format_spec),) = parse('f', '{ratio:.1%}', compile_f)
+    assert format_spec == '.1%'
+
+
+@pytest.mark.parametrize(
+    'template',
+    [
+        '',
+        'no fields',
+        '{{escaped}} {name}',
+        '{name=} {count = }',
+        '{ratio:.1%} {count:{width}d} {d["key"]!r:>{width}}',
+        "{d['key']!a}",
+        '{"\t"} {None\n}',
+        """ {f" { f' { f"{'X'}" } ' } "} """,
+        '{name # comment\n }',
+    ],
+)
+def test_render_matches_f(template):
+    assert render(parse('f', template, compile_f), {}, NAMESPACE) == f(
+        template, NAMESPACE
+    )
+
+
+@pytest.mark.parametrize(
+    'template',
+    [
+        '',
+        '{name=} {count = }',
+        '{ratio:.1%} {count:{width}d} {d["key"]!r:>{width}}',
+        '{"\t"}',
+    ],
+)
+def test_interpolate_matches_t(template):
+    parsed = interpolate(parse('t', template, compile_t), {}, NAMESPACE)
+    expected = t(template, NAMESPACE)
+    assert parsed.strings == expected.strings
+    assert [
+        (i.value, i.expression, i.conversion, i.format_spec)
+        for i in parsed.interpolations
+    ] == [
+        (i.value, i.expression, i.conversion, i.format_spec)
+        for i in expected.interpolations
+    ]
+
+
+def test_parse_errors():
+    with pytest.raises(SyntaxError):
+        parse('f', '{', compile_f)
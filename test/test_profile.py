@@ -0,0 +1,126 @@
+import io
+import time
+
+import pytest
+
+import fyeah
+from fyeah import f, t
+
+
+# ruff: noqa: F841
+
+
+class Slow:
+    def __format__(self, format_spec):
+        time.sleep(0.01)
+        return 'slow'
+
+
+@pytest.fixture(autouse=True)
+def fresh_profile():
+    fyeah.reset_profile()
+    fyeah.enable_profile()
+    yield
+    fyeah.enable_profile(False)
+    fyeah.reset_profile()
+
+
+def test_disabled():
+    fyeah.enable_profile(False)
+    f('{1}')
+    assert fyeah.profile() == []
+
+
+def test_f():
+    value = Slow()
+    assert f('{value} {value!r:.4} {1 + 1}') == 'slow <tes 2'
+    assert f('{value} {value!r:.4} {1 + 1}') == 'slow <tes 2'
+    entries = {entry.expression: entry for entry in fyeah.profile()}
+    assert entries['value'].calls == 4
+    assert entries['value'].format_seconds >= 0.02
+    assert entries['1 + 1'].calls == 2
+    assert entries['1 + 1'].template == '{value} {value!r:.4} {1 + 1}'
+    assert fyeah.profile()[0].expression == 'value'
+
+
+def test_eval_time():
+    assert f('{__import__("time").sleep(0.01)}') == 'None'
+    (entry,) = fyeah.profile()
+    assert entry.kind == 'f'
+    assert entry.eval_seconds >= 0.01
+    assert entry.format_seconds < 0.01
+
+
+def test_t():
+    value = 3
+    template = t('{value:>{value}}')
+    assert template.interpolations[0].format_spec == '>3'
+    assert sorted(
+        (entry.kind, entry.expression, entry.calls) for entry in fyeah.profile()
+    ) == [('t', 'value', 2)]
+
+
+def test_conversion_before_spec():
+    calls = []
+
+    class Recorded:
+        def __repr__(self):
+            calls.append('repr')
+            return 'recorded'
+
+    def width():
+        calls.append('width')
+        return 10
+
+    value = Recorded()
+    assert f('{value!r:>{width()}}') == '  recorded'
+    profiled = calls[:]
+    fyeah.enable_profile(False)
+    calls.clear()
+    assert f('{value!r:>{width()}}') == '  recorded'
+    assert profiled == calls == ['repr', 'width']
+
+
+def test_dedupe():
+    calls = []
+
+    def summary():
+        calls.append(None)
+        return 'ok'
+
+    assert f('{summary()} {summary()}', dedupe=True) == 'ok ok'
+    assert len(calls) == 1
+
+
+def test_error_still_recorded():
+    with pytest.raises(NameError):
+        f('{1} {missing}')
+    assert [entry.expression for entry in fyeah.profile()] == ['1']
+
+
+def test_callback():
+    renders = []
+    fyeah.enable_profile(callback=lambda *render: renders.append(render))
+    f('{1}{2}')
+    ((kind, template, timings),) = renders
+    assert (kind, template) == ('f', '{1}{2}')
+    assert [timing[0] for timing in timings] == ['1', '2']
+
+
+def test_print_profile():
+    value = Slow()
+    f('{value}')
+    f('{1}' * 100)
+    output = io.StringIO()
+    fyeah.print_profile(limit=1, file=output)
+    header, line = output.getvalue().splitlines()
+    assert 'expression in template' in header
+    assert line.endswith("value in f'{value}'")
+    output = io.StringIO()
+    fyeah.print_profile(sort='calls', limit=1, file=output)
+    assert output.getvalue().splitlines()[1].endswith("...'")
+
+
+def test_bad_sort():
+    with pytest.raises(ValueError):
+        fyeah.profile(sort='name')
@@ -0,0 +1,59 @@
+import html
+import shlex
+from string.templatelib import Interpolation, Template
+
+import pytest
+
+from fyeah import render, t
+
+
+# ruff: noqa: F841
+
+name = 'foo'
+
+
+def test_like_f_string():
+    ratio = 0.125
+    assert render(t'{name}') == 'foo'
+    assert (
+        render(t'hello {name!r:>7}, {ratio:.1%} done')
+        == f'hello {name!r:>7}, {ratio:.1%} done'
+    )
+    assert render(t'{name}{name}') == 'foofoo'
+    assert render(t'') == ''
+    assert render(t'{name=}') == "name='foo'"
+
+
+def test_nested_format_spec():
+    width = 5
+    assert render(t'{name:>{width}}') == '  foo'
+
+
+def test_from_t():
+    count = 3
+    assert render(t('{name} has {count:03} items')) == 'foo has 003 items'
+
+
+def test_escape():
+    name = '<b>ada & bob</b>'
+    template = t'<p class="user">{name}</p>'
+    assert render(template, escape=html.escape) == (
+        '<p class="user">&lt;b&gt;ada &amp; bob&lt;/b&gt;</p>'
+    )
+    path = "it's here"
+    assert render(t'ls {path}', escape=shlex.quote) == "ls 'it'\"'\"'s here'"
+
+
+def test_escape_after_format():
+    count = 7
+    assert render(t'{count:03}', escape=lambda value: f'[{value}]') == '[007]'
+
+
+def test_built_template():
+    template = Template('a', Interpolation(1, 'x', 'r', '>3'), Interpolation('b', 'y'))
+    assert render(template) == 'a  1b'
+
+
+def test_not_template():
+    with pytest.raises(TypeError):
+        render('{name}')
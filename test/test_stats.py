@@ -0,0 +1,66 @@
+import pytest
+
+import fyeah
+from fyeah import f, t
+
+
+# ruff: noqa: F841
+
+
+@pytest.fixture(autouse=True)
+def fresh_stats():
+    fyeah.cache_clear()
+    fyeah.reset_stats()
+    fyeah.enable_stats()
+    yield
+    fyeah.enable_stats(False)
+    fyeah.reset_stats()
+
+
+def test_disabled():
+    fyeah.enable_stats(False)
+    f('{1}')
+    assert fyeah.stats() == (0, 0, 0, 0, 0.0, 0.0, 0, 0)
+
+
+def test_f_counts():
+    value = 1
+    f('{value}')
+    f('{value}')
+    f('{None\n}')
+    stats = fyeah.stats()
+    assert stats.f_renders == 3
+    assert stats.t_renders == 0
+    assert stats.repr_compiles == 1
+    assert stats.escape_compiles == 1
+    assert stats.cache_hits == 1
+    assert stats.cache_misses == 2
+    assert stats.compile_seconds > 0
+    assert stats.eval_seconds > 0
+
+
+def test_t_counts():
+    value = 1
+    t('{value}')
+    t('{"\t"}')
+    t('{"\t"}')
+    stats = fyeah.stats()
+    assert stats.t_renders == 3
+    assert stats.repr_compiles == 1
+    assert stats.escape_compiles == 1
+    assert stats.cache_hits == 1
+
+
+def test_reset():
+    f('')
+    fyeah.reset_stats()
+    assert fyeah.stats() == (0, 0, 0, 0, 0.0, 0.0, 0, 0)
+
+
+def test_syntax_error_counts_match_cache_info():
+    for _ in range(3):
+        with pytest.raises(SyntaxError):
+            f('{')
+    stats = fyeah.stats()
+    assert (stats.cache_hits, stats.cache_misses) == (0, 3)
+    assert fyeah.cache_info()[:2] == (0, 3)
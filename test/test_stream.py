@@ -0,0 +1,77 @@
+import io
+
+import pytest
+
+from fyeah import f, iter_render, render_to
+
+
+# ruff: noqa: F841
+
+name = 'foo'
+
+
+def test_iter_render_chunks():
+    rows = ['a', 'b']
+    assert list(iter_render('{name}: {len(rows):>3}!{{}}')) == [
+        'foo',
+        ': ',
+        '  2',
+        '!{}',
+    ]
+
+
+def test_iter_render_lazy():
+    calls = []
+    chunks = iter_render('{calls.append(1)} {calls.append(2)}')
+    assert next(chunks) == 'None'
+    assert calls == [1]
+
+
+def test_iter_render_binds_scope_at_call():
+    def chunks():
+        local = 'bound'
+        return iter_render('{local}')
+
+    assert list(chunks()) == ['bound']
+
+
+def test_iter_render_binds_values_at_call():
+    value = 1
+    chunks = iter_render('{value}')
+    value = 2
+    assert list(chunks) == ['1']
+
+
+def test_render_to():
+    rows = '\n'.join(str(number) for number in range(1000))
+    template = 'header {name!r:^{width}}\n{rows}\nfooter {"\t"}'
+    width = 9
+    out = io.StringIO()
+    assert render_to(template, out) is None
+    assert out.getvalue() == f(template)
+
+
+def test_render_to_namespace():
+    out = io.StringIO()
+    render_to('{a}{b}', out, {'a': 1, 'b': 2})
+    assert out.getvalue() == '12'
+
+
+def test_errors():
+    with pytest.raises(SyntaxError):
+        iter_render('{')
+    with pytest.raises(TypeError):
+        render_to(b'', io.StringIO())
+
+
+def test_iter_render_frame():
+    import sys
+
+    def chunks(frame):
+        local = 'wrapper'
+        return iter_render('{local}', frame=frame)
+
+    local = 'caller'
+    assert list(chunks(sys._getframe())) == ['caller']
+    with pytest.raises(TypeError):
+        iter_render('{local}', {}, frame=sys._getframe())
@@ -380,3 +380,69 @@ def test_fstring_errors(error):
 def test_fstring_expr_errors(error):
     with pytest.raises(SyntaxError):
         t(error)
+
+
+def test_namespace_mapping():
+    row = {'name': 'bar', 'count': 2}
+    assert_equivalent_templates(
+        t('{name} x{count}', row),
+        Template(Interpolation('bar', 'name', None, ''), ' x', Interpolation(2, 'count', None, '')),
+    )
+
+
+def test_namespace_not_leaked():
+    with pytest.raises(NameError):
+        t('{outside}', {'name': 'bar'})
+
+
+def test_globals_and_locals():
+    assert_equivalent_templates(
+        t('{name}{outside}', globals={'name': 'g'}, locals={'outside': 'l'}),
+        Template(Interpolation('g', 'name', None, ''), Interpolation('l', 'outside', None, '')),
+    )
+
+
+def test_namespace_with_globals_error():
+    with pytest.raises(TypeError):
+        t('{name}', {'name': 'bar'}, locals={})
+
+
+def test_expression_text_kept():
+    d = {'key': 'door'}
+    assert_equivalent_templates(t('unlock {d["key"]}'), t'unlock {d["key"]}')
+    assert_equivalent_templates(t("unlock {d['key']!r}"), t"unlock {d['key']!r}")
+
+
+def test_dedupe():
+    calls = []
+
+    def summary():
+        calls.append(None)
+        return ['ok']
+
+    template = t('{summary()} and {summary()!r:>6}', dedupe=True)
+    assert len(calls) == 1
+    first, second = template.interpolations
+    assert first.value is second.value
+    assert (second.expression, second.conversion, second.format_spec) == ('summary()', 'r', '>6')
+
+
+def test_depth():
+    def wrapper(template):
+        name = 'wrapper'
+        return t(template, depth=2)
+
+    name = 'caller'
+    assert wrapper('{name}').values == ('caller',)
+
+
+def test_static_parts_shared():
+    # both the plain and escaped templates' literal strings and interpolation
+    # metadata are constants of their cached code, so every Template shares them
+    for template in ('{name!r:>10} and {outside}', '{name!r:>10} and {"\t"}'):
+        first, second = t(template), t(template)
+        assert first.strings is second.strings
+        for one, other in zip(first.interpolations, second.interpolations, strict=True):
+            assert one.expression is other.expression
+            assert one.conversion is other.conversion
+            assert one.format_spec is other.format_spec